@@ -7,8 +7,30 @@ from pathlib import Path
 import click
 
 from desktop_tester.models.project import ProjectConfig, TargetApp
-from desktop_tester.models.serialization import save_project, save_test_file
-from desktop_tester.models.step import ActionType, Step
+from desktop_tester.models.serialization import save_project
+
+# Pre-rendered example test written by `init`; kept in sync with
+# save_test_file() output by tests/unit/test_init_cmd.py.
+_EXAMPLE_TEST_YAML = """\
+name: Example Test
+description: An example test to get you started
+setup:
+- id: setup_1
+  action: launch_app
+  description: Launch app
+steps:
+- id: step_1
+  action: click
+  description: Click a button
+  target:
+    type: role_title
+    role: button
+    value: OK
+teardown:
+- id: teardown_1
+  action: close_app
+  description: Close app
+"""
 
 
 def execute_init(directory: str, name: str, target: str = "") -> None:
@@ -26,36 +48,19 @@ def execute_init(directory: str, name: str, target: str = "") -> None:
     )
 
     # Create directories
-    project_dir.mkdir(parents=True, exist_ok=True)
-    (project_dir / config.tests_dir).mkdir(exist_ok=True)
-    (project_dir / config.fixtures_dir).mkdir(exist_ok=True)
-    (project_dir / config.screenshots_dir).mkdir(exist_ok=True)
-    (project_dir / config.reports_dir).mkdir(exist_ok=True)
+    for sub in (
+        config.tests_dir,
+        config.fixtures_dir,
+        config.screenshots_dir,
+        config.reports_dir,
+    ):
+        (project_dir / sub).mkdir(parents=True, exist_ok=True)
 
     # Save project config
     save_project(project_dir / "project.yaml", config)
 
     # Create an example test
-    example_steps = [
-        Step(
-            id="step_1",
-            action=ActionType.CLICK,
-            description="Click a button",
-            target={"type": "role_title", "role": "button", "value": "OK"},
-        ),
-    ]
-    save_test_file(
-        project_dir / config.tests_dir / "test_example.yaml",
-        name="Example Test",
-        steps=example_steps,
-        description="An example test to get you started",
-        setup=[
-            Step(id="setup_1", action=ActionType.LAUNCH_APP, description="Launch app"),
-        ],
-        teardown=[
-            Step(id="teardown_1", action=ActionType.CLOSE_APP, description="Close app"),
-        ],
-    )
+    (project_dir / config.tests_dir / "test_example.yaml").write_text(_EXAMPLE_TEST_YAML)
 
     click.echo(f"\n  Project created: {project_dir}")
     click.echo(f"  Config: {project_dir / 'project.yaml'}")
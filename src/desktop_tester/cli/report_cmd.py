@@ -7,6 +7,11 @@ from pathlib import Path
 
 import click
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from desktop_tester.models.step import RunSummary, StepResult, TestResult
 
 
@@ -15,8 +20,8 @@ def execute_report(results_json: str, fmt: str, output: str) -> None:
     results_path = Path(results_json)
     output_path = Path(output)
 
-    with open(results_path, "r") as f:
-        data = json.load(f)
+    raw = results_path.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     # Reconstruct RunSummary from JSON
     summary = _json_to_summary(data)
@@ -33,31 +38,43 @@ def execute_report(results_json: str, fmt: str, output: str) -> None:
     click.echo(f"Report generated: {output_path}")
 
 
+# Field defaults used when rebuilding results from a JSON report.
+_STEP_RESULT_DEFAULTS = {
+    "step_id": "",
+    "status": "",
+    "duration_ms": 0,
+    "description": "",
+    "error_message": None,
+    "screenshot_path": None,
+    "actual_value": None,
+    "timestamp": "",
+}
+_TEST_RESULT_DEFAULTS = {
+    "test_name": "",
+    "test_file": "",
+    "status": "",
+    "duration_ms": 0,
+    "started_at": "",
+    "finished_at": "",
+}
+
+
+def _pick(data: dict, defaults: dict) -> dict:
+    return {key: data.get(key, default) for key, default in defaults.items()}
+
+
 def _json_to_summary(data: dict) -> RunSummary:
     """Convert a JSON dict back to a RunSummary."""
-    test_results = []
-    for tr_data in data.get("test_results", []):
-        step_results = [
-            StepResult(
-                step_id=sr.get("step_id", ""),
-                status=sr.get("status", ""),
-                duration_ms=sr.get("duration_ms", 0),
-                error_message=sr.get("error_message"),
-                screenshot_path=sr.get("screenshot_path"),
-                actual_value=sr.get("actual_value"),
-                timestamp=sr.get("timestamp", ""),
-            )
-            for sr in tr_data.get("step_results", [])
-        ]
-        test_results.append(TestResult(
-            test_name=tr_data.get("test_name", ""),
-            test_file=tr_data.get("test_file", ""),
-            status=tr_data.get("status", ""),
-            duration_ms=tr_data.get("duration_ms", 0),
-            step_results=step_results,
-            started_at=tr_data.get("started_at", ""),
-            finished_at=tr_data.get("finished_at", ""),
-        ))
+    test_results = [
+        TestResult(
+            **_pick(tr_data, _TEST_RESULT_DEFAULTS),
+            step_results=[
+                StepResult(**_pick(sr, _STEP_RESULT_DEFAULTS))
+                for sr in tr_data.get("step_results", [])
+            ],
+        )
+        for tr_data in data.get("test_results", [])
+    ]
 
     return RunSummary(
         total=data.get("total", 0),
@@ -2,13 +2,42 @@
 
 from __future__ import annotations
 
+import io
 import json
+import re
 from datetime import datetime
 from pathlib import Path
 
 import click
 
-from desktop_tester.models.serialization import load_project, load_yaml
+from desktop_tester.models.serialization import (
+    get_cached_yaml,
+    list_test_files,
+    load_project,
+)
+
+_OUTPUT_FLUSH_SIZE = 8192
+
+# click.echo strips the styling when stdout is not a terminal.
+_PASS_PREFIX = "  " + click.style("PASS", fg="green") + " "
+_FAIL_PREFIX = "  " + click.style("FAIL", fg="red") + " "
+
+
+def _filter_by_tags(paths: list[Path], tags: tuple[str, ...]) -> list[Path]:
+    """Keep only the test files whose ``tags`` list shares a tag with *tags*."""
+    # Cheap byte-level pre-scan: a file that never mentions any of the
+    # requested tags cannot match, so skip parsing it. Files that pass are
+    # parsed from the same bytes into the shared cache the runner reads.
+    tag_re = re.compile(b"|".join(re.escape(t.encode()) for t in tags))
+    wanted = frozenset(tags)
+    matched = []
+    for p in paths:
+        raw = p.read_bytes()
+        if not tag_re.search(raw):
+            continue
+        if not wanted.isdisjoint(get_cached_yaml(p, raw).get("tags") or []):
+            matched.append(p)
+    return matched
 
 
 def execute_run(
@@ -35,17 +64,6 @@ def execute_run(
     if slow_mode > 0:
         config.settings.slow_mode_delay = slow_mode
 
-    # Initialize the automation engine
-    try:
-        from desktop_tester.core import get_platform_backend
-        from desktop_tester.core.engine import AutomationEngine
-
-        backend = get_platform_backend()
-        engine = AutomationEngine(backend)
-    except Exception as e:
-        click.echo(f"Error initializing automation engine: {e}", err=True)
-        return 2
-
     # Discover test files
     tests_dir = project_path / config.tests_dir
     if test_files:
@@ -59,22 +77,27 @@ def execute_run(
             else:
                 click.echo(f"Warning: Test file not found: {p}", err=True)
     else:
-        paths = sorted(tests_dir.glob("*.yaml"))
+        paths = list_test_files(tests_dir)
 
     # Filter by tags if specified
     if tags:
-        filtered = []
-        for p in paths:
-            data = load_yaml(p)
-            file_tags = set(data.get("tags", []))
-            if file_tags & set(tags):
-                filtered.append(p)
-        paths = filtered
+        paths = _filter_by_tags(paths, tags)
 
     if not paths:
         click.echo("No test files found to run.", err=True)
         return 2
 
+    # Initialize the automation engine
+    try:
+        from desktop_tester.core import get_platform_backend
+        from desktop_tester.core.engine import AutomationEngine
+
+        backend = get_platform_backend()
+        engine = AutomationEngine(backend)
+    except Exception as e:
+        click.echo(f"Error initializing automation engine: {e}", err=True)
+        return 2
+
     click.echo(f"\n  DesktopTester v{config.version}")
     click.echo(f"  Project: {config.name}")
     click.echo(f"  Tests: {len(paths)}")
@@ -85,25 +108,44 @@ def execute_run(
 
     runner = TestRunner(engine, project_path, config)
 
-    # Connect verbose output
+    # Per-step verbose output is buffered and flushed in chunks (and at the
+    # end of each test) rather than echoed line by line.
+    out = io.StringIO()
+
+    def flush_output() -> None:
+        if out.tell():
+            click.echo(out.getvalue(), nl=False)
+            out.seek(0)
+            out.truncate(0)
+
+    def on_test_started(name: str, _path: Path) -> None:
+        # Shown immediately so a slow or hung test is visible
+        out.write(f"  Running: {name}\n")
+        flush_output()
+
+    def on_step_completed(r) -> None:
+        out.write(f"    {r.step_id}: {r.status.upper()} ({r.duration_ms:.0f}ms)")
+        if r.error_message:
+            out.write(f" - {r.error_message}")
+        out.write("\n")
+        if out.tell() > _OUTPUT_FLUSH_SIZE:
+            flush_output()
+
+    def on_test_completed(r) -> None:
+        flush_output()
+        prefix = _PASS_PREFIX if r.status == "passed" else _FAIL_PREFIX
+        click.echo(prefix + r.test_name + f" ({r.duration_ms:.0f}ms)")
+
     if verbose:
-        runner.test_started.connect(lambda name: click.echo(f"  Running: {name}"))
-        runner.step_completed.connect(
-            lambda r: click.echo(
-                f"    {r.step_id}: {r.status.upper()} ({r.duration_ms:.0f}ms)"
-                + (f" - {r.error_message}" if r.error_message else "")
-            )
-        )
-
-    runner.test_completed.connect(
-        lambda r: click.echo(
-            f"  {'PASS' if r.status == 'passed' else 'FAIL'} "
-            f"{r.test_name} ({r.duration_ms:.0f}ms)"
-        )
-    )
+        runner.test_started.connect(on_test_started)
+        runner.step_completed.connect(on_step_completed)
+
+    runner.test_completed.connect(on_test_completed)
 
     summary = runner.run_all(paths)
-    summary.finished_at = datetime.now().isoformat()
+    finished = datetime.now()
+    summary.finished_at = finished.isoformat()
+    stamp = finished.strftime("%Y%m%d_%H%M%S")
 
     # Generate reports
     report_dir = Path(output_dir) if output_dir else project_path / config.reports_dir
@@ -114,12 +156,12 @@ def execute_run(
     generator = ReportGenerator()
 
     if report_format in ("html", "both"):
-        html_path = report_dir / f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+        html_path = report_dir / f"report_{stamp}.html"
         generator.generate_html(summary, html_path)
         click.echo(f"\n  HTML report: {html_path}")
 
     if report_format in ("json", "both"):
-        json_path = report_dir / f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        json_path = report_dir / f"report_{stamp}.json"
         generator.generate_json(summary, json_path)
         click.echo(f"  JSON report: {json_path}")
 
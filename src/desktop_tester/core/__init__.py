@@ -3,13 +3,28 @@
 from __future__ import annotations
 
 import sys
+import threading
 
 from desktop_tester.core.platform_base import PlatformBackend
 from desktop_tester.exceptions import PlatformNotSupportedError
 
+_BACKEND: PlatformBackend | None = None
+_BACKEND_LOCK = threading.Lock()
+
 
 def get_platform_backend() -> PlatformBackend:
-    """Factory: return the appropriate backend for the current OS."""
+    """Factory: return the appropriate backend for the current OS.
+
+    The backend is created once per process and shared by later callers.
+    """
+    global _BACKEND
+    with _BACKEND_LOCK:
+        if _BACKEND is None:
+            _BACKEND = _create_platform_backend()
+        return _BACKEND
+
+
+def _create_platform_backend() -> PlatformBackend:
     if sys.platform == "darwin":
         from desktop_tester.core.macos_backend import MacOSBackend
         return MacOSBackend()
@@ -18,3 +33,10 @@ def get_platform_backend() -> PlatformBackend:
         return WindowsBackend()
     else:
         raise PlatformNotSupportedError(f"Unsupported platform: {sys.platform}")
+
+
+def _reset_backend_for_tests() -> None:
+    """Forget the cached backend so the next call creates a new one."""
+    global _BACKEND
+    with _BACKEND_LOCK:
+        _BACKEND = None
@@ -24,12 +24,19 @@ class AppManager:
     def is_connected(self) -> bool:
         return self._app_ref is not None
 
-    def launch(self, target: TargetApp) -> object:
-        """Launch the target application."""
+    @staticmethod
+    def _identifier(target: TargetApp) -> str:
+        """Return the identifier used to launch *target*."""
         identifier = target.bundle_id or target.path or target.name
         if not identifier:
             raise ValueError("No application identifier configured in target_app")
+        return identifier
+
+    def launch(self, target: TargetApp) -> object:
+        """Launch the target application."""
+        return self._launch(target, self._identifier(target))
 
+    def _launch(self, target: TargetApp, identifier: str) -> object:
         self._target = target
         self._app_ref = self._backend.launch_application(
             identifier, target.launch_args or None
@@ -43,14 +50,16 @@ class AppManager:
 
     def launch_or_attach(self, target: TargetApp) -> object:
         """Try to attach first; launch if not running."""
-        identifier = target.bundle_id or target.name or target.path
-        if not identifier:
-            raise ValueError("No application identifier configured in target_app")
-
-        try:
-            return self.attach(identifier)
-        except Exception:
-            return self.launch(target)
+        identifier = self._identifier(target)
+        # Backends attach by bundle ID, name, or PID -- never by path -- so
+        # only try attaching when one of those is configured.
+        attach_id = target.bundle_id or target.name
+        if attach_id:
+            try:
+                return self.attach(attach_id)
+            except Exception:
+                return self._launch(target, identifier)
+        return self._launch(target, identifier)
 
     def disconnect(self) -> None:
         """Disconnect from the current application."""
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 from typing import Any, Optional
 
 
@@ -17,9 +18,13 @@ class LocatorType(Enum):
     COORDINATE = "coordinate"
 
 
-@dataclass
+@dataclass(frozen=True)
 class LocatorStrategy:
-    """Defines how to find a UI element, with optional fallback chain."""
+    """Defines how to find a UI element, with optional fallback chain.
+
+    Locators are immutable value objects; use dataclasses.replace() to
+    derive a variant (e.g. with a different timeout).
+    """
 
     type: LocatorType
     value: str
@@ -29,6 +34,15 @@ class LocatorStrategy:
     fallback: Optional[LocatorStrategy] = None
 
     def to_dict(self) -> dict[str, Any]:
+        """Serialize to a dict.
+
+        The dict is built once per locator and shared between calls, so
+        callers must not mutate it.
+        """
+        return self._dict
+
+    @cached_property
+    def _dict(self) -> dict[str, Any]:
         d: dict[str, Any] = {"type": self.type.value, "value": self.value}
         if self.role:
             d["role"] = self.role
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-import io
 import subprocess
 import sys
+import threading
 import time
-from typing import Any, Optional
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional
 
 if sys.platform != "darwin":
     raise ImportError("macOS backend can only be imported on macOS")
@@ -17,13 +20,18 @@ from ApplicationServices import (
     AXIsProcessTrusted,
     AXUIElementCopyAttributeValue,
     AXUIElementCopyElementAtPosition,
+    AXUIElementCopyMultipleAttributeValues,
+    AXUIElementCopyParameterizedAttributeValue,
     AXUIElementCreateApplication,
     AXUIElementCreateSystemWide,
+    AXUIElementGetPid,
     AXUIElementPerformAction,
     AXUIElementSetAttributeValue,
+    AXValueGetType,
+    AXValueGetTypeID,
+    kAXValueAXErrorType,
 )
-from CoreFoundation import CFRelease
-from PIL import Image
+from CoreFoundation import CFGetTypeID
 
 from desktop_tester.core.locator import LocatorStrategy, LocatorType
 from desktop_tester.core.platform_base import PlatformBackend
@@ -106,7 +114,107 @@ _KEY_MAP = {
     "5": 0x17, "6": 0x16, "7": 0x1A, "8": 0x1C, "9": 0x19,
 }
 
-_MODIFIER_KEYS = {"cmd", "command", "shift", "option", "alt", "control", "ctrl"}
+# Modifier key name -> CGEvent flag mask
+_MODIFIER_FLAGS = {
+    "cmd": Quartz.kCGEventFlagMaskCommand,
+    "command": Quartz.kCGEventFlagMaskCommand,
+    "shift": Quartz.kCGEventFlagMaskShift,
+    "option": Quartz.kCGEventFlagMaskAlternate,
+    "alt": Quartz.kCGEventFlagMaskAlternate,
+    "control": Quartz.kCGEventFlagMaskControl,
+    "ctrl": Quartz.kCGEventFlagMaskControl,
+}
+
+# Key name -> (keycode, modifier flag mask); the mask is 0 for regular keys.
+# One lookup classifies a key in perform_key_combo.
+_KEY_TABLE = {
+    name: (keycode, _MODIFIER_FLAGS.get(name, 0)) for name, keycode in _KEY_MAP.items()
+}
+
+# Attributes fetched in one round-trip when wrapping an element during a
+# tree walk. AXChildren rides along so the walk needs no second call.
+_WRAP_ATTRS = (
+    "AXRole",
+    "AXTitle",
+    "AXDescription",
+    "AXValue",
+    "AXIdentifier",
+    "AXPosition",
+    "AXSize",
+    "AXEnabled",
+    "AXChildren",
+)
+
+# Attributes needed to collect a child's text (and descend if it has none).
+_TEXT_ATTRS = ("AXValue", "AXTitle", "AXChildren")
+
+_AX_VALUE_TYPE_ID = AXValueGetTypeID()
+
+# Control and format characters that commonly show up in element text: C0/C1
+# controls, soft hyphen, zero-width and bidi marks, isolates, and the BOM.
+_CTRL_TABLE = dict.fromkeys(
+    [
+        *range(0x20), *range(0x7F, 0xA0), 0xAD,
+        *range(0x200B, 0x2010), *range(0x202A, 0x202F),
+        *range(0x2060, 0x2065), *range(0x2066, 0x206A), 0xFEFF,
+    ]
+)
+
+# Search depth for element lookups. Native Cocoa UIs are shallow; Chromium
+# and Electron apps nest web content much deeper.
+_NATIVE_MAX_DEPTH = 10
+_WEB_MAX_DEPTH = 15
+
+# Enough for any label; stops get_element_text walking a whole document.
+_MAX_CHILD_TEXT = 4096
+
+# Threads used to walk an app's top-level subtrees when snapshotting it.
+_SUBTREE_WORKERS = 4
+
+# Maximum UTF-16 units macOS delivers from one CGEventKeyboardSetUnicodeString
+_UNICODE_EVENT_LIMIT = 20
+
+# find_element polling: start at 20 ms, grow 1.5x per miss, cap at 500 ms
+_POLL_INITIAL = 0.02
+_POLL_BACKOFF = 1.5
+_POLL_MAX = 0.5
+
+# How long a tree snapshot may answer lookups before it is re-walked.
+_SNAPSHOT_TTL = 0.5
+
+# How long the running-application list is reused between lookups.
+_RUNNING_APPS_TTL = 0.2
+
+# Normalized role -> AX search key for AXUIElementsForSearchPredicate queries
+# inside web areas. Roles not listed search with AXAnyTypeSearchKey.
+_SEARCH_KEY_MAP = {
+    "button": "AXButtonSearchKey",
+    "checkbox": "AXCheckBoxSearchKey",
+    "link": "AXLinkSearchKey",
+    "text_field": "AXTextFieldSearchKey",
+    "text_area": "AXTextFieldSearchKey",
+    "static_text": "AXStaticTextSearchKey",
+    "image": "AXGraphicSearchKey",
+    "table": "AXTableSearchKey",
+    "list": "AXListSearchKey",
+}
+
+# Locator types whose value can be passed as AXSearchText.
+_SEARCHABLE_LOCATORS = {LocatorType.ROLE_AND_TITLE, LocatorType.ROLE_AND_LABEL}
+
+# Apps whose UI is mostly web content get the deeper search limit.
+_WEB_BUNDLE_PREFIXES = (
+    # Chromium and Electron
+    "com.google.Chrome",
+    "com.microsoft.edgemac",
+    "com.brave.Browser",
+    "com.vivaldi.Vivaldi",
+    "org.chromium.",
+    "com.github.Electron",
+    # WebKit
+    "com.apple.Safari",
+    "com.apple.WebKit",
+)
 
 
 def _ax_attr(element: Any, attr: str) -> Any:
@@ -117,9 +225,140 @@ def _ax_attr(element: Any, attr: str) -> Any:
     return value
 
 
+def _ax_attrs(element: Any, attrs: tuple[str, ...]) -> dict[str, Any]:
+    """Read several accessibility attributes in a single IPC round-trip.
+
+    Attributes that are missing or fail to read map to None.
+    """
+    err, values = AXUIElementCopyMultipleAttributeValues(element, attrs, 0, None)
+    if err != 0 or values is None:
+        return dict.fromkeys(attrs)
+    result: dict[str, Any] = {}
+    for attr, value in zip(attrs, values):
+        if isinstance(value, Cocoa.NSNull) or _is_ax_error(value):
+            value = None
+        result[attr] = value
+    return result
+
+
+def _is_ax_error(value: Any) -> bool:
+    """True if *value* is the AXValue placeholder for an attribute that failed to read."""
+    try:
+        return (
+            CFGetTypeID(value) == _AX_VALUE_TYPE_ID
+            and AXValueGetType(value) == kAXValueAXErrorType
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+def _is_web_bundle(bundle_id: str, bundle_path: Path | None) -> bool:
+    """True for Chromium, WebKit and Electron browsers and apps."""
+    if bundle_id.startswith(_WEB_BUNDLE_PREFIXES):
+        return True
+    if bundle_path is None:
+        return False
+    frameworks = bundle_path / "Contents" / "Frameworks"
+    return (frameworks / "Electron Framework.framework").exists()
+
+
+def _is_web_app(app: Any) -> bool:
+    bundle_url = app.bundleURL()
+    bundle_path = Path(str(bundle_url.path())) if bundle_url is not None else None
+    return _is_web_bundle(str(app.bundleIdentifier() or ""), bundle_path)
+
+
+def _compile_matcher(locator: LocatorStrategy) -> Callable[[UIElement], bool]:
+    """Build a predicate testing whether a UIElement matches *locator*.
+
+    The dispatch on locator type (and any parsing of its value) happens once
+    here rather than for every node visited during a tree walk.
+    """
+    value = locator.value
+    role = locator.role
+
+    if locator.type == LocatorType.ACCESSIBILITY_ID:
+        return lambda e: e.identifier == value
+
+    elif locator.type == LocatorType.ROLE_AND_TITLE:
+        # Match against title, value, or label
+        if role is None:
+            return lambda e: e.title == value or e.value == value or e.label == value
+        return lambda e: e.role == role and (
+            e.title == value or e.value == value or e.label == value
+        )
+
+    elif locator.type == LocatorType.ROLE_AND_LABEL:
+        if role is None:
+            return lambda e: e.label == value
+        return lambda e: e.role == role and e.label == value
+
+    elif locator.type == LocatorType.TEXT_CONTENT:
+        return lambda e: (
+            value in (e.title or "") or value in (e.value or "") or value in (e.label or "")
+        )
+
+    elif locator.type == LocatorType.PATH:
+        return lambda e: e.path == value
+
+    elif locator.type == LocatorType.COORDINATE:
+        # Coordinate matching: check if element contains the point
+        parts = value.split(",")
+        if len(parts) == 2:
+            px, py = int(parts[0].strip()), int(parts[1].strip())
+            return lambda e: e.x <= px <= e.x + e.width and e.y <= py <= e.y + e.height
+
+    return lambda e: False
+
+
+def _normalize_role(raw_role: Any) -> str:
+    """Map a raw AXRole to our normalized role name."""
+    role_str = str(raw_role) if raw_role else "unknown"
+    return _ROLE_MAP.get(role_str, role_str.replace("AX", "").lower())
+
+
+def _compile_prefilter(locator: LocatorStrategy) -> Callable[[dict[str, Any]], bool] | None:
+    """Build a cheap check on raw AX attributes that rejects non-matching nodes.
+
+    It runs before a node is wrapped in a UIElement, so nodes it rejects skip
+    the text cleaning and geometry decoding entirely. It may accept nodes the
+    full matcher later rejects, never the reverse. Returns None when the
+    locator has nothing cheap to check.
+    """
+    if locator.type == LocatorType.ACCESSIBILITY_ID:
+        value = locator.value
+        return lambda attrs: bool(attrs["AXIdentifier"]) and str(attrs["AXIdentifier"]) == value
+    if locator.type in (LocatorType.ROLE_AND_TITLE, LocatorType.ROLE_AND_LABEL) and locator.role:
+        role = locator.role
+        return lambda attrs: _normalize_role(attrs["AXRole"]) == role
+    return None
+
+
+def _utf16_chunks(text: str, limit: int) -> list[str]:
+    """Split text into pieces of at most *limit* UTF-16 units, keeping surrogate pairs whole."""
+    chunks: list[str] = []
+    start = 0
+    units = 0
+    for i, char in enumerate(text):
+        width = 2 if ord(char) > 0xFFFF else 1
+        if units + width > limit:
+            chunks.append(text[start:i])
+            start = i
+            units = 0
+        units += width
+    if start < len(text):
+        chunks.append(text[start:])
+    return chunks
+
+
 def _clean_text(text: str) -> str:
     """Strip Unicode control characters (e.g. LTR marks) from element text."""
-    import unicodedata
+    if text.isprintable():
+        return text
+    text = text.translate(_CTRL_TABLE)
+    if text.isascii():
+        return text
+    # Rare leftovers (private-use, unassigned, other format chars) need a lookup.
     return "".join(c for c in text if unicodedata.category(c)[0] != "C")
 
 
@@ -129,6 +368,16 @@ class MacOSBackend(PlatformBackend):
     def __init__(self):
         if not AXIsProcessTrusted():
             raise AccessibilityPermissionError()
+        # Reused for every hit test and synthesized input event
+        self._system_wide = AXUIElementCreateSystemWide()
+        self._event_source = Quartz.CGEventSourceCreate(Quartz.kCGEventSourceStateHIDSystemState)
+        self._workspace = Cocoa.NSWorkspace.sharedWorkspace()
+        # (fetched_at, apps); see _running_apps()
+        self._running_apps_cache: tuple[float, Any] | None = None
+        # PID -> search depth, decided once per process
+        self._depth_cache: dict[int, int] = {}
+        # PID -> (taken_at, every element in document order); see _snapshot()
+        self._snapshots: dict[int, tuple[float, list[UIElement]]] = {}
 
     # --- Element discovery ---
 
@@ -136,12 +385,23 @@ class MacOSBackend(PlatformBackend):
         deadline = time.time() + locator.timeout
         current_locator: LocatorStrategy | None = locator
 
+        # A fresh snapshot answers the first attempt without touching AX;
+        # retries always search the live tree.
+        snapshot = self._snapshot(app_ref)
+        if snapshot is not None:
+            result = self._pick_match(snapshot, locator)
+            if result is not None:
+                return result
+
         while current_locator is not None:
+            # Poll quickly at first, backing off for elements that are slow to appear
+            interval = _POLL_INITIAL
             while time.time() < deadline:
                 result = self._search_element(app_ref, current_locator)
                 if result is not None:
                     return result
-                time.sleep(0.25)
+                time.sleep(max(0.0, min(interval, deadline - time.time())))
+                interval = min(interval * _POLL_BACKOFF, _POLL_MAX)
             # Try fallback locator if available
             current_locator = current_locator.fallback
             if current_locator:
@@ -150,14 +410,15 @@ class MacOSBackend(PlatformBackend):
         raise ElementNotFoundError(locator.to_dict(), locator.timeout)
 
     def find_elements(self, app_ref: object, locator: LocatorStrategy) -> list[UIElement]:
-        results: list[UIElement] = []
-        self._search_elements(app_ref, locator, results, max_depth=15)
-        return results
+        snapshot = self._snapshot(app_ref)
+        if snapshot is None:
+            snapshot = self._take_snapshot(app_ref)
+        matches = _compile_matcher(locator)
+        return [element for element in snapshot if matches(element)]
 
     def get_element_at_point(self, x: int, y: int) -> UIElement | None:
-        system_wide = AXUIElementCreateSystemWide()
         err, native_element = AXUIElementCopyElementAtPosition(
-            system_wide, float(x), float(y), None
+            self._system_wide, float(x), float(y), None
         )
         if err != 0 or native_element is None:
             return None
@@ -184,19 +445,23 @@ class MacOSBackend(PlatformBackend):
         return self._collect_child_text(element._native_ref, depth=0, max_depth=5)
 
     def _collect_child_text(self, ax_ref: Any, depth: int, max_depth: int) -> str:
-        """Recursively collect text from child elements."""
-        if depth > max_depth:
-            return ""
+        """Collect text from child elements, descending into those without any.
 
-        children = _ax_attr(ax_ref, "AXChildren")
-        if not children:
+        Iterative depth-first walk; text is gathered in document order. The
+        walk stops once more than _MAX_CHILD_TEXT characters are collected.
+        """
+        if depth > max_depth:
             return ""
 
         parts: list[str] = []
-        for child in children:
-            role = _ax_attr(child, "AXRole")
-            value = _ax_attr(child, "AXValue")
-            title = _ax_attr(child, "AXTitle")
+        total = 0
+        children = _ax_attr(ax_ref, "AXChildren")
+        stack: list[tuple[Any, int]] = [(child, depth) for child in reversed(children or ())]
+        while stack:
+            child, child_depth = stack.pop()
+            attrs = _ax_attrs(child, _TEXT_ATTRS)
+            value = attrs["AXValue"]
+            title = attrs["AXTitle"]
 
             text = None
             if value is not None:
@@ -206,11 +471,14 @@ class MacOSBackend(PlatformBackend):
 
             if text:
                 parts.append(text)
-            else:
-                # Recurse deeper
-                nested = self._collect_child_text(child, depth + 1, max_depth)
-                if nested:
-                    parts.append(nested)
+                total += len(text)
+                if total > _MAX_CHILD_TEXT:
+                    break
+            elif child_depth + 1 <= max_depth and attrs["AXChildren"]:
+                stack.extend(
+                    (grandchild, child_depth + 1)
+                    for grandchild in reversed(attrs["AXChildren"])
+                )
 
         return " ".join(parts)
 
@@ -220,6 +488,7 @@ class MacOSBackend(PlatformBackend):
     # --- Actions ---
 
     def perform_click(self, element: UIElement) -> None:
+        self._snapshots.clear()
         if element._native_ref is not None:
             # Try AX action first
             err = AXUIElementPerformAction(element._native_ref, "AXPress")
@@ -229,33 +498,36 @@ class MacOSBackend(PlatformBackend):
         self._cg_click(element.center)
 
     def perform_double_click(self, element: UIElement) -> None:
+        self._snapshots.clear()
         cx, cy = element.center
         point = Quartz.CGPointMake(cx, cy)
         event = Quartz.CGEventCreateMouseEvent(
-            None, Quartz.kCGEventLeftMouseDown, point, Quartz.kCGMouseButtonLeft
+            self._event_source, Quartz.kCGEventLeftMouseDown, point, Quartz.kCGMouseButtonLeft
         )
         Quartz.CGEventSetIntegerValueField(event, Quartz.kCGMouseEventClickState, 2)
         Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
 
         event_up = Quartz.CGEventCreateMouseEvent(
-            None, Quartz.kCGEventLeftMouseUp, point, Quartz.kCGMouseButtonLeft
+            self._event_source, Quartz.kCGEventLeftMouseUp, point, Quartz.kCGMouseButtonLeft
         )
         Quartz.CGEventSetIntegerValueField(event_up, Quartz.kCGMouseEventClickState, 2)
         Quartz.CGEventPost(Quartz.kCGHIDEventTap, event_up)
 
     def perform_right_click(self, element: UIElement) -> None:
+        self._snapshots.clear()
         cx, cy = element.center
         point = Quartz.CGPointMake(cx, cy)
         event_down = Quartz.CGEventCreateMouseEvent(
-            None, Quartz.kCGEventRightMouseDown, point, Quartz.kCGMouseButtonRight
+            self._event_source, Quartz.kCGEventRightMouseDown, point, Quartz.kCGMouseButtonRight
         )
         Quartz.CGEventPost(Quartz.kCGHIDEventTap, event_down)
         event_up = Quartz.CGEventCreateMouseEvent(
-            None, Quartz.kCGEventRightMouseUp, point, Quartz.kCGMouseButtonRight
+            self._event_source, Quartz.kCGEventRightMouseUp, point, Quartz.kCGMouseButtonRight
         )
         Quartz.CGEventPost(Quartz.kCGHIDEventTap, event_up)
 
     def perform_type_text(self, element: UIElement, text: str) -> None:
+        self._snapshots.clear()
         # First try setting the value directly via accessibility
         if element._native_ref is not None:
             err = AXUIElementSetAttributeValue(element._native_ref, "AXValue", text)
@@ -265,61 +537,74 @@ class MacOSBackend(PlatformBackend):
         # Fallback: click the element first, then type via CGEvents
         self.perform_click(element)
         time.sleep(0.1)
-        for char in text:
-            self._type_char(char)
-            time.sleep(0.02)
+        self._type_string(text)
 
     def type_keys(self, text: str) -> None:
         """Type text into the currently focused element via keyboard events."""
-        for char in text:
-            self._type_char(char)
-            time.sleep(0.02)
+        self._snapshots.clear()
+        self._type_string(text)
 
     def perform_key_combo(self, keys: list[str]) -> None:
-        modifiers: list[str] = []
-        regular_keys: list[str] = []
+        self._snapshots.clear()
+        modifiers: list[tuple[int, int]] = []
+        regular_keys: list[int] = []
 
         for key in keys:
-            key_lower = key.lower()
-            if key_lower in _MODIFIER_KEYS:
-                modifiers.append(key_lower)
+            entry = _KEY_TABLE.get(key.lower())
+            if entry is None:
+                continue
+            if entry[1]:
+                modifiers.append(entry)
             else:
-                regular_keys.append(key_lower)
-
-        # Build modifier flags
+                regular_keys.append(entry[0])
+
+        # Build the whole sequence first: modifiers go down in order, each
+        # regular key is pressed with the full flag set, then modifiers are
+        # released in reverse, so apps reading either flags or modifier
+        # keycodes see the combo.
+        events: list[Any] = []
+        pressed: list[tuple[int, int]] = []
         flags = 0
-        for mod in modifiers:
-            if mod in ("cmd", "command"):
-                flags |= Quartz.kCGEventFlagMaskCommand
-            elif mod == "shift":
-                flags |= Quartz.kCGEventFlagMaskShift
-            elif mod in ("option", "alt"):
-                flags |= Quartz.kCGEventFlagMaskAlternate
-            elif mod in ("control", "ctrl"):
-                flags |= Quartz.kCGEventFlagMaskControl
-
-        for key_name in regular_keys:
-            keycode = _KEY_MAP.get(key_name)
-            if keycode is None:
-                continue
-            event_down = Quartz.CGEventCreateKeyboardEvent(None, keycode, True)
-            event_up = Quartz.CGEventCreateKeyboardEvent(None, keycode, False)
-            if flags:
-                Quartz.CGEventSetFlags(event_down, flags)
-                Quartz.CGEventSetFlags(event_up, flags)
-            Quartz.CGEventPost(Quartz.kCGHIDEventTap, event_down)
-            Quartz.CGEventPost(Quartz.kCGHIDEventTap, event_up)
+        for keycode, mask in modifiers:
+            if flags & mask:
+                continue  # Aliases such as "cmd" + "command"
+            flags |= mask
+            pressed.append((keycode, mask))
+            events.append(self._key_event(keycode, True, flags))
+
+        for keycode in regular_keys:
+            events.append(self._key_event(keycode, True, flags or None))
+            events.append(self._key_event(keycode, False, flags or None))
+
+        for keycode, mask in reversed(pressed):
+            flags &= ~mask
+            events.append(self._key_event(keycode, False, flags))
+
+        for event in events:
+            Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+    def _key_event(self, keycode: int, key_down: bool, flags: int | None) -> Any:
+        """Create a keyboard event, overriding its modifier state unless *flags* is None."""
+        event = Quartz.CGEventCreateKeyboardEvent(self._event_source, keycode, key_down)
+        if flags is not None:
+            Quartz.CGEventSetFlags(event, flags)
+        return event
 
     # --- Application management ---
 
     def launch_application(self, path: str, args: list[str] | None = None) -> object:
-        workspace = Cocoa.NSWorkspace.sharedWorkspace()
+        self._snapshots.clear()
+        self._running_apps_cache = None
+        workspace = self._workspace
 
         # Try bundle ID first
         if "." in path and "/" not in path:
             # Looks like a bundle ID
             url = workspace.URLForApplicationWithBundleIdentifier_(path)
             if url:
+                app = self._open_application_url(workspace, url)
+                if app is not None:
+                    return AXUIElementCreateApplication(app.processIdentifier())
                 result = subprocess.run(
                     ["open", "-b", path], capture_output=True, timeout=10
                 )
@@ -335,6 +620,26 @@ class MacOSBackend(PlatformBackend):
             raise ApplicationNotFoundError(f"Failed to launch {path}: {result.stderr.decode()}")
         return self._wait_and_attach(path)
 
+    @staticmethod
+    def _open_application_url(workspace: Any, url: Any, timeout: float = 10.0) -> Any:
+        """Launch the app at *url* in-process and return its NSRunningApplication.
+
+        Returns None if the launch fails or does not complete within *timeout*.
+        """
+        done = threading.Event()
+        launched: list[Any] = []
+
+        def on_launched(app: Any, error: Any) -> None:
+            if error is None and app is not None:
+                launched.append(app)
+            done.set()
+
+        config = Cocoa.NSWorkspaceOpenConfiguration.configuration()
+        workspace.openApplicationAtURL_configuration_completionHandler_(url, config, on_launched)
+        if not done.wait(timeout) or not launched:
+            return None
+        return launched[0]
+
     def _wait_and_attach(self, identifier: str, timeout: float = 10.0) -> object:
         """Wait for an application to appear and attach to it."""
         deadline = time.time() + timeout
@@ -348,42 +653,56 @@ class MacOSBackend(PlatformBackend):
         )
 
     def attach_to_application(self, identifier: str) -> object:
-        running_apps = Cocoa.NSWorkspace.sharedWorkspace().runningApplications()
-        for app in running_apps:
-            bid = app.bundleIdentifier()
-            name = app.localizedName()
-            if bid and bid == identifier:
+        # PID and bundle ID have direct Cocoa lookups; only names need a scan.
+        if identifier.isdigit():
+            app = Cocoa.NSRunningApplication.runningApplicationWithProcessIdentifier_(
+                int(identifier)
+            )
+            if app is not None:
                 return AXUIElementCreateApplication(app.processIdentifier())
+
+        by_bundle = Cocoa.NSRunningApplication.runningApplicationsWithBundleIdentifier_(identifier)
+        if by_bundle:
+            return AXUIElementCreateApplication(by_bundle[0].processIdentifier())
+
+        for app in self._running_apps():
+            name = app.localizedName()
             if name and name == identifier:
                 return AXUIElementCreateApplication(app.processIdentifier())
-            # Also try PID
-            if identifier.isdigit() and app.processIdentifier() == int(identifier):
-                return AXUIElementCreateApplication(app.processIdentifier())
 
         raise ApplicationNotFoundError(f"Application not found: {identifier}")
 
     def terminate_application(self, app_ref: object) -> None:
+        self._snapshots.clear()
+        self._running_apps_cache = None
         # Extract PID from the AXUIElement app ref
-        from ApplicationServices import AXUIElementGetPid
         err, pid = AXUIElementGetPid(app_ref, None)
         if err != 0:
             return
 
         # Find the NSRunningApplication for this PID and terminate it
-        running_apps = Cocoa.NSWorkspace.sharedWorkspace().runningApplications()
-        for app in running_apps:
-            if app.processIdentifier() == pid:
-                app.terminate()
-                # Wait for it to actually quit
-                deadline = time.time() + 5.0
-                while time.time() < deadline and not app.isTerminated():
-                    time.sleep(0.2)
-                return
+        app = Cocoa.NSRunningApplication.runningApplicationWithProcessIdentifier_(pid)
+        if app is None:
+            return
+        app.terminate()
+        # Wait for it to actually quit
+        deadline = time.time() + 5.0
+        while time.time() < deadline and not app.isTerminated():
+            time.sleep(0.2)
+
+    def _running_apps(self) -> Any:
+        """Return runningApplications(), reused for up to _RUNNING_APPS_TTL seconds."""
+        now = time.monotonic()
+        cached = self._running_apps_cache
+        if cached is not None and now - cached[0] <= _RUNNING_APPS_TTL:
+            return cached[1]
+        apps = self._workspace.runningApplications()
+        self._running_apps_cache = (now, apps)
+        return apps
 
     def list_running_applications(self) -> list[dict]:
-        running_apps = Cocoa.NSWorkspace.sharedWorkspace().runningApplications()
         result = []
-        for app in running_apps:
+        for app in self._running_apps():
             if app.activationPolicy() == Cocoa.NSApplicationActivationPolicyRegular:
                 result.append({
                     "name": str(app.localizedName() or ""),
@@ -399,7 +718,6 @@ class MacOSBackend(PlatformBackend):
         Scans /Applications and ~/Applications for .app bundles.
         """
         import plistlib
-        from pathlib import Path
 
         search_dirs = [
             Path("/Applications"),
@@ -479,8 +797,6 @@ class MacOSBackend(PlatformBackend):
 
     def _find_window_id(self, app_ref: object) -> int | None:
         """Find the main window ID for the application referenced by app_ref."""
-        from ApplicationServices import AXUIElementGetPid
-
         err, pid = AXUIElementGetPid(app_ref, None)
         if err != 0:
             return None
@@ -503,37 +819,41 @@ class MacOSBackend(PlatformBackend):
 
     @staticmethod
     def _cgimage_to_png(image: object) -> bytes:
-        """Convert a CGImage to PNG bytes."""
-        width = Quartz.CGImageGetWidth(image)
-        height = Quartz.CGImageGetHeight(image)
-        bytes_per_row = Quartz.CGImageGetBytesPerRow(image)
-        data_provider = Quartz.CGImageGetDataProvider(image)
-        raw_data = Quartz.CGDataProviderCopyData(data_provider)
-
-        # Pass bytes_per_row as stride — CGImage may pad rows for alignment
-        pil_image = Image.frombytes(
-            "RGBA", (width, height), bytes(raw_data), "raw", "BGRA", bytes_per_row, 1
-        )
+        """Convert a CGImage to PNG bytes.
 
-        buf = io.BytesIO()
-        pil_image.save(buf, format="PNG")
-        return buf.getvalue()
+        ImageIO encodes straight from the CGImage into a CFMutableData, so
+        pixels are never copied into Python.
+        """
+        data = Cocoa.NSMutableData.data()
+        dest = Quartz.CGImageDestinationCreateWithData(data, "public.png", 1, None)
+        if dest is None:
+            return b""
+        Quartz.CGImageDestinationAddImage(dest, image, None)
+        if not Quartz.CGImageDestinationFinalize(dest):
+            return b""
+        return bytes(data)
 
     # --- Internal helpers ---
 
-    def _wrap_native_element(self, native_ref: Any) -> UIElement:
-        """Convert a native AXUIElement to our UIElement."""
-        raw_role = _ax_attr(native_ref, "AXRole")
-        role_str = str(raw_role) if raw_role else "unknown"
-        normalized_role = _ROLE_MAP.get(role_str, role_str.replace("AX", "").lower())
+    def _wrap_native_element(
+        self, native_ref: Any, attrs: dict[str, Any] | None = None
+    ) -> UIElement:
+        """Convert a native AXUIElement to our UIElement.
 
-        title = _ax_attr(native_ref, "AXTitle")
-        desc = _ax_attr(native_ref, "AXDescription")
-        value = _ax_attr(native_ref, "AXValue")
-        identifier = _ax_attr(native_ref, "AXIdentifier")
-        position = _ax_attr(native_ref, "AXPosition")
-        size = _ax_attr(native_ref, "AXSize")
-        enabled = _ax_attr(native_ref, "AXEnabled")
+        *attrs* may carry attributes already fetched with _ax_attrs(); they
+        are read in one batch otherwise.
+        """
+        if attrs is None:
+            attrs = _ax_attrs(native_ref, _WRAP_ATTRS)
+        normalized_role = _normalize_role(attrs["AXRole"])
+
+        title = attrs["AXTitle"]
+        desc = attrs["AXDescription"]
+        value = attrs["AXValue"]
+        identifier = attrs["AXIdentifier"]
+        position = attrs["AXPosition"]
+        size = attrs["AXSize"]
+        enabled = attrs["AXEnabled"]
 
         x, y = 0, 0
         w, h = 0, 0
@@ -564,120 +884,234 @@ class MacOSBackend(PlatformBackend):
             _native_ref=native_ref,
         )
 
+    def _snapshot(self, app_ref: object) -> list[UIElement] | None:
+        """Return the app's element snapshot if it is younger than _SNAPSHOT_TTL.
+
+        Snapshots are dropped whenever this backend sends input or launches
+        or terminates an app, since any of those can change the UI.
+        """
+        err, pid = AXUIElementGetPid(app_ref, None)
+        if err != 0:
+            return None
+        entry = self._snapshots.get(pid)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > _SNAPSHOT_TTL:
+            # Let the stale elements (and the AX refs they hold) go now.
+            del self._snapshots[pid]
+            return None
+        return entry[1]
+
+    def _take_snapshot(self, app_ref: object) -> list[UIElement]:
+        """Walk the whole tree once, remembering every element for reuse."""
+        taken_at = time.monotonic()
+        max_depth = self._search_depth(app_ref)
+        attrs = _ax_attrs(app_ref, _WRAP_ATTRS)
+        elements = [self._wrap_native_element(app_ref, attrs)]
+        top_level = list(attrs["AXChildren"] or ()) if max_depth > 0 else []
+
+        # Each top-level subtree (usually a window) costs one IPC round-trip
+        # per node; walking them on a few threads overlaps that latency.
+        # map() keeps the results in document order.
+        if len(top_level) > 1:
+            workers = min(_SUBTREE_WORKERS, len(top_level))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                subtrees = pool.map(
+                    lambda child: self._walk_subtree(child, 1, max_depth), top_level
+                )
+                for subtree in subtrees:
+                    elements.extend(subtree)
+        elif top_level:
+            elements.extend(self._walk_subtree(top_level[0], 1, max_depth))
+
+        # Drop expired snapshots of other apps so their AX refs are not kept
+        # alive until the next input event.
+        expired = [p for p, (t, _) in self._snapshots.items() if taken_at - t > _SNAPSHOT_TTL]
+        for p in expired:
+            del self._snapshots[p]
+
+        err, pid = AXUIElementGetPid(app_ref, None)
+        if err == 0:
+            self._snapshots[pid] = (taken_at, elements)
+        return elements
+
+    def _walk_subtree(self, root: Any, depth: int, max_depth: int) -> list[UIElement]:
+        """Wrap every element under *root* in depth-first document order."""
+        elements: list[UIElement] = []
+        stack: list[tuple[Any, int]] = [(root, depth)]
+        while stack:
+            node, node_depth = stack.pop()
+            attrs = _ax_attrs(node, _WRAP_ATTRS)
+            elements.append(self._wrap_native_element(node, attrs))
+            children = attrs["AXChildren"]
+            if children and node_depth < max_depth:
+                stack.extend((child, node_depth + 1) for child in reversed(children))
+        return elements
+
+    def _pick_match(
+        self, elements: list[UIElement], locator: LocatorStrategy
+    ) -> UIElement | None:
+        """Return the locator.index-th element of *elements* matching *locator*."""
+        idx = locator.index if locator.index is not None else 0
+        matches = _compile_matcher(locator)
+        for element in elements:
+            if matches(element):
+                if idx == 0:
+                    return element
+                idx -= 1
+        return None
+
     def _search_element(self, ax_ref: object, locator: LocatorStrategy) -> UIElement | None:
         """Search the accessibility tree for a matching element."""
-        results: list[UIElement] = []
-        self._search_elements(ax_ref, locator, results, max_depth=15)
-        if not results:
-            return None
         idx = locator.index if locator.index is not None else 0
+        results: list[UIElement] = []
+        # Stop walking as soon as the requested match has been seen.
+        self._search_elements(
+            ax_ref, locator, results, max_depth=self._search_depth(ax_ref), limit=idx + 1
+        )
         if idx < len(results):
             return results[idx]
         return None
 
+    def _search_depth(self, app_ref: object) -> int:
+        """Pick how deep to search an app's tree based on its UI framework."""
+        err, pid = AXUIElementGetPid(app_ref, None)
+        if err != 0:
+            return _WEB_MAX_DEPTH
+        depth = self._depth_cache.get(pid)
+        if depth is None:
+            app = Cocoa.NSRunningApplication.runningApplicationWithProcessIdentifier_(pid)
+            is_web = app is not None and _is_web_app(app)
+            depth = _WEB_MAX_DEPTH if is_web else _NATIVE_MAX_DEPTH
+            self._depth_cache[pid] = depth
+        return depth
+
     def _search_elements(
         self, ax_ref: object, locator: LocatorStrategy,
-        results: list[UIElement], max_depth: int = 15, depth: int = 0
+        results: list[UIElement], max_depth: int = 15, limit: int | None = None,
     ) -> None:
-        """Recursively search for elements matching the locator."""
-        if depth > max_depth:
-            return
-
-        element = self._wrap_native_element(ax_ref)
-
-        if self._matches_locator(element, locator):
-            results.append(element)
+        """Collect elements matching the locator, in depth-first document order.
 
-        # Recurse into children
-        children = _ax_attr(ax_ref, "AXChildren")
-        if children:
-            for child in children:
-                self._search_elements(child, locator, results, max_depth, depth + 1)
-
-    def _matches_locator(self, element: UIElement, locator: LocatorStrategy) -> bool:
-        """Check if a UIElement matches the given locator."""
-        if locator.type == LocatorType.ACCESSIBILITY_ID:
-            return element.identifier == locator.value
-
-        elif locator.type == LocatorType.ROLE_AND_TITLE:
-            role_match = locator.role is None or element.role == locator.role
-            # Match against title, value, or label
-            value_match = (
-                element.title == locator.value
-                or element.value == locator.value
-                or element.label == locator.value
-            )
-            return role_match and value_match
-
-        elif locator.type == LocatorType.ROLE_AND_LABEL:
-            role_match = locator.role is None or element.role == locator.role
-            return role_match and element.label == locator.value
+        Stops early once *limit* matches have been collected.
+        """
+        matches = _compile_matcher(locator)
+        prefilter = _compile_prefilter(locator)
+        stack: list[tuple[Any, int]] = [(ax_ref, 0)]
+        while stack:
+            node, depth = stack.pop()
+            attrs = _ax_attrs(node, _WRAP_ATTRS)
+
+            # Only build a UIElement for nodes that could possibly match.
+            if prefilter is None or prefilter(attrs):
+                element = self._wrap_native_element(node, attrs)
+                if matches(element):
+                    results.append(element)
+                    if limit is not None and len(results) >= limit:
+                        return
+
+            # Let the web area filter its own subtree instead of walking it here.
+            if attrs["AXRole"] == "AXWebArea" and locator.type in _SEARCHABLE_LOCATORS:
+                remaining = None if limit is None else limit - len(results)
+                found = self._search_web_area(node, locator, remaining)
+                # An empty result may just mean the query missed; walk the subtree.
+                if found:
+                    for match in found:
+                        results.append(match)
+                        if limit is not None and len(results) >= limit:
+                            return
+                    continue
 
-        elif locator.type == LocatorType.TEXT_CONTENT:
-            return (
-                locator.value in (element.title or "")
-                or locator.value in (element.value or "")
-                or locator.value in (element.label or "")
-            )
+            children = attrs["AXChildren"]
+            if children and depth < max_depth:
+                stack.extend((child, depth + 1) for child in reversed(children))
 
-        elif locator.type == LocatorType.PATH:
-            return element.path == locator.value
-
-        elif locator.type == LocatorType.COORDINATE:
-            # Coordinate matching: check if element contains the point
-            parts = locator.value.split(",")
-            if len(parts) == 2:
-                px, py = int(parts[0].strip()), int(parts[1].strip())
-                return (
-                    element.x <= px <= element.x + element.width
-                    and element.y <= py <= element.y + element.height
-                )
-            return False
+    def _search_web_area(
+        self, web_area: Any, locator: LocatorStrategy, limit: int | None = None
+    ) -> list[UIElement] | None:
+        """Find matching elements in a web area with AXUIElementsForSearchPredicate.
 
-        return False
+        The query runs inside the target process, so only candidate elements
+        cross the IPC boundary; they are then checked against the locator
+        until *limit* matches are found. Returns None if the web area does not
+        support the query.
+        """
+        query = {
+            "AXSearchKey": _SEARCH_KEY_MAP.get(locator.role or "", "AXAnyTypeSearchKey"),
+            "AXSearchText": locator.value,
+            "AXDirection": "AXDirectionNext",
+            "AXImmediateDescendantsOnly": False,
+            "AXResultsLimit": -1,
+        }
+        err, candidates = AXUIElementCopyParameterizedAttributeValue(
+            web_area, "AXUIElementsForSearchPredicate", query, None
+        )
+        if err != 0 or candidates is None:
+            return None
+        is_match = _compile_matcher(locator)
+        matches: list[UIElement] = []
+        for candidate in candidates:
+            element = self._wrap_native_element(candidate)
+            if is_match(element):
+                matches.append(element)
+                if limit is not None and len(matches) >= limit:
+                    break
+        return matches
 
     def _build_tree(self, ax_ref: object, depth: int, max_depth: int) -> dict:
         """Build a dict representation of the accessibility tree."""
-        element = self._wrap_native_element(ax_ref)
-        node: dict[str, Any] = {
-            "role": element.role,
-            "title": element.title,
-            "label": element.label,
-            "value": element.value,
-            "identifier": element.identifier,
-            "bounds": element.bounds,
-        }
-
-        if depth < max_depth:
-            children = _ax_attr(ax_ref, "AXChildren")
-            if children:
-                node["children"] = [
-                    self._build_tree(child, depth + 1, max_depth)
-                    for child in children
-                ]
+        top: list[dict] = []
+        # Each entry carries the list its node should be appended to.
+        stack: list[tuple[Any, int, list[dict]]] = [(ax_ref, depth, top)]
+        while stack:
+            node_ref, node_depth, siblings = stack.pop()
+            attrs = _ax_attrs(node_ref, _WRAP_ATTRS)
+            element = self._wrap_native_element(node_ref, attrs)
+            node: dict[str, Any] = {
+                "role": element.role,
+                "title": element.title,
+                "label": element.label,
+                "value": element.value,
+                "identifier": element.identifier,
+                "bounds": element.bounds,
+            }
+            siblings.append(node)
+
+            if node_depth < max_depth:
+                children = attrs["AXChildren"]
+                if children:
+                    node["children"] = []
+                    stack.extend(
+                        (child, node_depth + 1, node["children"])
+                        for child in reversed(children)
+                    )
 
-        return node
+        return top[0]
 
     def _cg_click(self, point: tuple[int, int]) -> None:
         """Perform a click via CGEvents at the given coordinates."""
         cx, cy = point
         cg_point = Quartz.CGPointMake(cx, cy)
         event_down = Quartz.CGEventCreateMouseEvent(
-            None, Quartz.kCGEventLeftMouseDown, cg_point, Quartz.kCGMouseButtonLeft
+            self._event_source, Quartz.kCGEventLeftMouseDown, cg_point, Quartz.kCGMouseButtonLeft
         )
         event_up = Quartz.CGEventCreateMouseEvent(
-            None, Quartz.kCGEventLeftMouseUp, cg_point, Quartz.kCGMouseButtonLeft
+            self._event_source, Quartz.kCGEventLeftMouseUp, cg_point, Quartz.kCGMouseButtonLeft
         )
         Quartz.CGEventPost(Quartz.kCGHIDEventTap, event_down)
         time.sleep(0.05)
         Quartz.CGEventPost(Quartz.kCGHIDEventTap, event_up)
 
-    def _type_char(self, char: str) -> None:
-        """Type a single character via CGEvents."""
-        # Use CGEventKeyboardSetUnicodeString for reliable character input
-        event_down = Quartz.CGEventCreateKeyboardEvent(None, 0, True)
-        event_up = Quartz.CGEventCreateKeyboardEvent(None, 0, False)
-        Quartz.CGEventKeyboardSetUnicodeString(event_down, len(char), char)
-        Quartz.CGEventKeyboardSetUnicodeString(event_up, len(char), char)
-        Quartz.CGEventPost(Quartz.kCGHIDEventTap, event_down)
-        Quartz.CGEventPost(Quartz.kCGHIDEventTap, event_up)
+    def _type_string(self, text: str) -> None:
+        """Type text via CGEvents, several characters per keyboard event.
+
+        macOS only honours the first 20 UTF-16 units attached to a single
+        event, so longer text is sent in chunks of that size.
+        """
+        for chunk in _utf16_chunks(text, _UNICODE_EVENT_LIMIT):
+            units = len(chunk.encode("utf-16-le")) // 2
+            event_down = Quartz.CGEventCreateKeyboardEvent(self._event_source, 0, True)
+            event_up = Quartz.CGEventCreateKeyboardEvent(self._event_source, 0, False)
+            Quartz.CGEventKeyboardSetUnicodeString(event_down, units, chunk)
+            Quartz.CGEventKeyboardSetUnicodeString(event_up, units, chunk)
+            Quartz.CGEventPost(Quartz.kCGHIDEventTap, event_down)
+            Quartz.CGEventPost(Quartz.kCGHIDEventTap, event_up)
@@ -0,0 +1,10 @@
+"""Windows automation backend using pywinauto (stub for Phase 2).
+
+Only the stub exists so far. It imports nothing platform-specific, so
+this package can be imported (and tested) on any OS; the pywinauto
+implementation will be selected here on Windows once it lands.
+"""
+
+from desktop_tester.core.windows_backend._impl_stub import WindowsBackend
+
+__all__ = ["WindowsBackend"]
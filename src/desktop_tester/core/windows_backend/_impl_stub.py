@@ -0,0 +1,28 @@
+"""Placeholder Windows backend whose methods all raise NotImplementedError."""
+
+from __future__ import annotations
+
+import abc
+
+from desktop_tester.core.platform_base import PlatformBackend
+
+_MSG = "Windows backend not yet implemented"
+
+
+def _not_implemented(self, *args, **kwargs):
+    raise NotImplementedError(_MSG)
+
+
+class WindowsBackend(PlatformBackend):
+    """Windows implementation using pywinauto UI Automation.
+
+    This is a stub for Phase 2 implementation. Every abstract method of
+    PlatformBackend is bound to one shared function raising
+    NotImplementedError.
+    """
+
+
+for _name in PlatformBackend.__abstractmethods__:
+    setattr(WindowsBackend, _name, _not_implemented)
+abc.update_abstractmethods(WindowsBackend)
+del _name
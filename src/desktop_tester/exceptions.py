@@ -6,12 +6,20 @@ class DesktopTesterError(Exception):
 
 
 class ElementNotFoundError(DesktopTesterError):
-    """Raised when a UI element cannot be found within the timeout."""
+    """Raised when a UI element cannot be found within the timeout.
+
+    The message is only formatted when the exception is turned into a
+    string, so retry loops that catch and discard it never pay for it.
+    """
 
     def __init__(self, locator, timeout: float = 0):
         self.locator = locator
         self.timeout = timeout
-        super().__init__(f"Element not found: {locator} (timeout: {timeout}s)")
+        # Raw args keep repr() informative and let the error round-trip via pickle
+        super().__init__(locator, timeout)
+
+    def __str__(self) -> str:
+        return f"Element not found: {self.locator} (timeout: {self.timeout}s)"
 
 
 class ElementTimeoutError(DesktopTesterError):
@@ -26,15 +34,21 @@ class ApplicationNotRunningError(DesktopTesterError):
     """Raised when trying to interact with an app that is not running."""
 
 
-class AssertionError(DesktopTesterError):
+class TestAssertionError(DesktopTesterError):
     """Raised when a test assertion fails."""
 
+    __test__ = False  # Not a pytest test class despite the name
+
     def __init__(self, message: str, expected=None, actual=None):
         self.expected = expected
         self.actual = actual
         super().__init__(message)
 
 
+# Deprecated alias; shadows the builtin for anyone importing it by name.
+AssertionError = TestAssertionError
+
+
 class RecordingError(DesktopTesterError):
     """Raised when recording encounters an error."""
 
@@ -50,8 +64,10 @@ class PlatformNotSupportedError(DesktopTesterError):
 class AccessibilityPermissionError(DesktopTesterError):
     """Raised when accessibility permissions are not granted."""
 
+    _MSG = (
+        "Accessibility permissions not granted. "
+        "Please enable in System Settings > Privacy & Security > Accessibility."
+    )
+
     def __init__(self):
-        super().__init__(
-            "Accessibility permissions not granted. "
-            "Please enable in System Settings > Privacy & Security > Accessibility."
-        )
+        super().__init__(self._MSG)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 
 from PySide6.QtWidgets import (
@@ -13,12 +14,38 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QPushButton,
     QVBoxLayout,
+    QWidget,
 )
 
 
+@cache
+def _app_selector_cls():
+    """Import AppSelectorDialog on first use and keep the class."""
+    from desktop_tester.gui.widgets.app_selector import AppSelectorDialog
+
+    return AppSelectorDialog
+
+
+class _PickerRow(QWidget):
+    """A line edit with a button beside it, added to a form as one row."""
+
+    def __init__(self, placeholder: str, button_text: str, on_click, parent=None):
+        super().__init__(parent)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.edit = QLineEdit()
+        self.edit.setPlaceholderText(placeholder)
+        layout.addWidget(self.edit)
+        self.button = QPushButton(button_text)
+        self.button.clicked.connect(on_click)
+        layout.addWidget(self.button)
+
+
 class NewProjectDialog(QDialog):
     """Dialog for creating a new DesktopTester project."""
 
+    _BUTTONS = QDialogButtonBox.Ok | QDialogButtonBox.Cancel
+
     def __init__(self, apps: list[dict] | None = None, parent=None):
         super().__init__(parent)
         self.setWindowTitle("New Project")
@@ -36,58 +63,64 @@ class NewProjectDialog(QDialog):
         form.addRow("Project Name:", self._name_edit)
 
         # Directory picker
-        dir_row = QHBoxLayout()
-        self._dir_edit = QLineEdit()
-        self._dir_edit.setPlaceholderText("Select project directory...")
-        dir_row.addWidget(self._dir_edit)
-        browse_btn = QPushButton("Browse...")
-        browse_btn.clicked.connect(self._browse_directory)
-        dir_row.addWidget(browse_btn)
+        dir_row = _PickerRow("Select project directory...", "Browse...", self._browse_directory)
+        self._dir_edit = dir_row.edit
         form.addRow("Directory:", dir_row)
 
         # Target app with select button
-        app_row = QHBoxLayout()
-        self._target_edit = QLineEdit()
-        self._target_edit.setPlaceholderText("Bundle ID or app name (e.g., com.apple.calculator)")
-        app_row.addWidget(self._target_edit)
-        select_btn = QPushButton("Select...")
-        select_btn.clicked.connect(self._select_app)
-        select_btn.setEnabled(bool(self._apps))
-        app_row.addWidget(select_btn)
+        app_row = _PickerRow(
+            "Bundle ID or app name (e.g., com.apple.calculator)", "Select...", self._select_app
+        )
+        app_row.button.setEnabled(bool(self._apps))
+        self._target_edit = app_row.edit
         form.addRow("Target App:", app_row)
 
         layout.addLayout(form)
 
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        # Stripped field text, re-read lazily after each textChanged
+        self._text_cache: dict[QLineEdit, str] = {}
+        for edit in (self._name_edit, self._dir_edit, self._target_edit):
+            edit.textChanged.connect(lambda _text, e=edit: self._text_cache.pop(e, None))
+
+        buttons = QDialogButtonBox(self._BUTTONS)
         buttons.accepted.connect(self._on_accept)
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
     @property
     def project_name(self) -> str:
-        return self._name_edit.text().strip()
+        return self._field_text(self._name_edit)
+
+    @property
+    def project_directory_str(self) -> str | None:
+        return self._field_text(self._dir_edit) or None
 
     @property
     def project_directory(self) -> Path | None:
-        text = self._dir_edit.text().strip()
+        text = self.project_directory_str
         return Path(text) if text else None
 
     @property
     def target_app(self) -> str:
-        return self._target_edit.text().strip()
+        return self._field_text(self._target_edit)
 
     @property
     def selected_app(self) -> dict | None:
         return self._selected_app
 
+    def _field_text(self, edit: QLineEdit) -> str:
+        text = self._text_cache.get(edit)
+        if text is None:
+            text = self._text_cache[edit] = edit.text().strip()
+        return text
+
     def _browse_directory(self) -> None:
         path = QFileDialog.getExistingDirectory(self, "Select Project Directory")
         if path:
             self._dir_edit.setText(path)
 
     def _select_app(self) -> None:
-        from desktop_tester.gui.widgets.app_selector import AppSelectorDialog
-
+        AppSelectorDialog = _app_selector_cls()
         dialog = AppSelectorDialog(self._apps, self)
         if dialog.exec() == AppSelectorDialog.Accepted and dialog.selected_app:
             self._selected_app = dialog.selected_app
@@ -96,5 +129,5 @@ class NewProjectDialog(QDialog):
             self._target_edit.setText(bundle_id or name)
 
     def _on_accept(self) -> None:
-        if self.project_name and self.project_directory:
+        if self.project_name and self.project_directory_str:
             self.accept()
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import re
+
+from PySide6.QtCore import QRegularExpression, QTimer
+from PySide6.QtGui import QRegularExpressionValidator
 from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -10,10 +14,25 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
+# Runs of anything but letters, digits and underscores (same set as isalnum() or "_")
+_SLUG_STRIP_RE = re.compile(r"\W+")
+
+# Spaces and hyphens both become underscores, in one pass
+_SLUG_SEPARATORS = str.maketrans({" ": "_", "-": "_"})
+
+# What may be typed into the filename field: the slug characters above,
+# optionally followed by the .yaml extension
+_FILENAME_PATTERN = r"\w*(\.yaml)?"
+
+# Delay after the last keystroke before the filename is regenerated
+_AUTO_FILENAME_DELAY_MS = 80
+
 
 class NewTestDialog(QDialog):
     """Dialog for creating a new test file."""
 
+    _BUTTONS = QDialogButtonBox.Ok | QDialogButtonBox.Cancel
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("New Test")
@@ -28,45 +47,82 @@ class NewTestDialog(QDialog):
 
         self._filename_edit = QLineEdit()
         self._filename_edit.setPlaceholderText("test_basic_addition")
+        self._filename_edit.setClearButtonEnabled(True)
+        # Reject characters the slug would strip as they are typed, in Qt
+        self._filename_edit.setValidator(
+            QRegularExpressionValidator(
+                QRegularExpression(
+                    _FILENAME_PATTERN, QRegularExpression.UseUnicodePropertiesOption
+                ),
+                self._filename_edit,
+            )
+        )
         form.addRow("Filename:", self._filename_edit)
 
         self._desc_edit = QLineEdit()
         self._desc_edit.setPlaceholderText("Optional description")
         form.addRow("Description:", self._desc_edit)
 
-        # Auto-fill filename from name
-        self._name_edit.textChanged.connect(self._auto_filename)
+        # Auto-fill filename from name, once typing pauses
+        self._pending_name = ""
+        self._slug_timer = QTimer(self)
+        self._slug_timer.setSingleShot(True)
+        self._slug_timer.setInterval(_AUTO_FILENAME_DELAY_MS)
+        self._slug_timer.timeout.connect(self._do_auto_filename)
+        self._name_edit.textChanged.connect(self._schedule_auto_filename)
 
         layout.addLayout(form)
 
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        # Stripped field text, re-read lazily after each textChanged
+        self._text_cache: dict[QLineEdit, str] = {}
+        for edit in (self._name_edit, self._filename_edit, self._desc_edit):
+            edit.textChanged.connect(lambda _text, e=edit: self._text_cache.pop(e, None))
+
+        buttons = QDialogButtonBox(self._BUTTONS)
         buttons.accepted.connect(self._on_accept)
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
     @property
     def test_name(self) -> str:
-        return self._name_edit.text().strip()
+        return self._field_text(self._name_edit)
 
     @property
     def filename(self) -> str:
-        text = self._filename_edit.text().strip()
+        text = self._field_text(self._filename_edit)
         if not text.endswith(".yaml"):
             text += ".yaml"
         return text
 
     @property
     def description(self) -> str:
-        return self._desc_edit.text().strip()
+        return self._field_text(self._desc_edit)
+
+    def _field_text(self, edit: QLineEdit) -> str:
+        text = self._text_cache.get(edit)
+        if text is None:
+            text = self._text_cache[edit] = edit.text().strip()
+        return text
+
+    def _schedule_auto_filename(self, name: str) -> None:
+        self._pending_name = name
+        self._slug_timer.start()
+
+    def _do_auto_filename(self) -> None:
+        self._auto_filename(self._pending_name)
 
     def _auto_filename(self, name: str) -> None:
         """Auto-generate filename from the test name."""
-        slug = name.lower().replace(" ", "_").replace("-", "_")
-        slug = "".join(c for c in slug if c.isalnum() or c == "_")
+        slug = name.lower().translate(_SLUG_SEPARATORS)
+        slug = _SLUG_STRIP_RE.sub("", slug)
         if slug and not slug.startswith("test_"):
             slug = "test_" + slug
         self._filename_edit.setText(slug)
 
     def _on_accept(self) -> None:
+        # Apply a filename update still waiting on the debounce timer
+        if self._slug_timer.isActive():
+            self._slug_timer.stop()
+            self._do_auto_filename()
         if self.test_name:
             self.accept()
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import importlib
+import sys
+import time
+from datetime import datetime
+from functools import cache
 from pathlib import Path
+from typing import Any
 
-from PySide6.QtCore import QSettings, Qt
+import yaml
+from PySide6.QtCore import QObject, QSettings, Qt, QThreadPool, QTimer, Signal
 from PySide6.QtWidgets import (
     QFileDialog,
     QMainWindow,
@@ -17,8 +24,6 @@ from PySide6.QtWidgets import (
 )
 
 from desktop_tester.constants import APP_NAME
-from desktop_tester.gui.dialogs.new_project import NewProjectDialog
-from desktop_tester.gui.dialogs.new_test import NewTestDialog
 from desktop_tester.gui.widgets.app_selector import AppSelectorDialog
 from desktop_tester.gui.widgets.code_editor import CodeEditor
 from desktop_tester.gui.widgets.results_panel import ResultsPanel
@@ -37,6 +42,86 @@ from desktop_tester.models.serialization import (
 from desktop_tester.models.step import ActionType, Step, StepResult, TestResult
 
 
+@cache
+def _lazy(module: str, name: str | None = None) -> Any:
+    """Import *module* (or *name* from it) on first use and keep the result.
+
+    Engine, recorder, runner and platform modules stay out of MainWindow
+    construction, and later calls cost a dict lookup instead of an import.
+    """
+    mod = importlib.import_module(module)
+    return mod if name is None else getattr(mod, name)
+
+
+# How long the installed-applications scan is reused, in seconds
+_INSTALLED_APPS_TTL = 60.0
+
+# Recorded steps arriving within one frame are added to the list together
+_RECORD_FLUSH_MS = 16
+
+# Suffix for generated report filenames, e.g. report_20240101_120000.html
+_REPORT_TIMESTAMP_FMT = "%Y%m%d_%H%M%S"
+
+# Detail tab indices. Every tab but Step Details is built on first use.
+_TAB_STEP, _TAB_SCREENSHOT, _TAB_CODE, _TAB_RESULTS = range(4)
+
+
+class _TestFileLoader(QObject):
+    """Parses test files on the global thread pool.
+
+    Results are emitted from the worker thread; connected GUI slots run
+    queued on the GUI thread.
+    """
+
+    loaded = Signal(int, object, object)  # request id, Path, parsed test data
+    failed = Signal(int, object, str)  # request id, Path, error message
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._last_id = 0
+
+    def load(self, path: Path) -> int:
+        """Start parsing *path* and return the id its result will carry."""
+        self._last_id += 1
+        request_id = self._last_id
+        QThreadPool.globalInstance().start(lambda: self._parse(request_id, path))
+        return request_id
+
+    def _parse(self, request_id: int, path: Path) -> None:
+        try:
+            data = load_test_file(path)
+        except Exception as e:
+            self.failed.emit(request_id, path, str(e))
+            return
+        self.loaded.emit(request_id, path, data)
+
+
+class _ReportWriter(QObject):
+    """Writes HTML run reports on the global thread pool."""
+
+    written = Signal(object, object)  # RunSummary, Path
+    failed = Signal(object, str)  # RunSummary, error message
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._generator = None
+
+    def write(self, summary, path: Path) -> None:
+        """Start rendering *summary* to *path*."""
+        if self._generator is None:
+            ReportGenerator = _lazy("desktop_tester.reporter.reporter", "ReportGenerator")
+            self._generator = ReportGenerator()
+        QThreadPool.globalInstance().start(lambda: self._write(summary, path))
+
+    def _write(self, summary, path: Path) -> None:
+        try:
+            self._generator.generate_html(summary, path)
+        except Exception as e:
+            self.failed.emit(summary, str(e))
+            return
+        self.written.emit(summary, path)
+
+
 class MainWindow(QMainWindow):
     """Main application window with 3-panel layout."""
 
@@ -48,12 +133,28 @@ class MainWindow(QMainWindow):
         # State
         self._project_dir: Path | None = None
         self._project_config: ProjectConfig | None = None
+        self._tests_path: Path | None = None  # Resolved from project config on load
+        self._reports_path: Path | None = None
         self._current_test_path: Path | None = None
         self._engine = None
+        self._connected_identifier: str | None = None  # App the engine last attached to
         self._recorder = None
         self._runner = None
         self._runner_worker = None
         self._pick_monitor = None  # One-shot NSEvent monitor for element picking
+        self._screen_height: float | None = None  # Main screen height, in points
+        self._screen_observer = None  # Screen-parameter change observer token
+        self._pending_steps: list[Step] = []  # Recorded, not yet in the step list
+        self._flush_scheduled = False
+        self._apps_cache: tuple[float, list[dict]] | None = None  # (scanned_at, apps)
+        self._settings = QSettings("DesktopTester", "DesktopTester")
+        self._test_loader = _TestFileLoader(self)
+        self._test_loader.loaded.connect(self._on_test_file_loaded, Qt.QueuedConnection)
+        self._test_loader.failed.connect(self._on_test_file_failed, Qt.QueuedConnection)
+        self._report_writer = _ReportWriter(self)
+        self._report_writer.written.connect(self._on_report_written, Qt.QueuedConnection)
+        self._report_writer.failed.connect(self._on_report_failed, Qt.QueuedConnection)
+        self._open_request = 0  # Only the most recently requested test is shown
 
         # --- Build UI ---
         self._setup_toolbar()
@@ -67,9 +168,13 @@ class MainWindow(QMainWindow):
         # Restore last project
         self._restore_last_project()
 
+    def closeEvent(self, event) -> None:
+        # Write settings out once on exit rather than after every change
+        self._settings.sync()
+        super().closeEvent(event)
+
     def _restore_last_project(self) -> None:
-        settings = QSettings("DesktopTester", "DesktopTester")
-        last_project = settings.value("last_project_dir")
+        last_project = self._settings.value("last_project_dir")
         if last_project:
             project_dir = Path(last_project)
             if (project_dir / "project.yaml").exists():
@@ -97,21 +202,23 @@ class MainWindow(QMainWindow):
 
         self._detail_tabs = QTabWidget()
 
-        # Tab 1: Step Editor
+        # Tab 1: Step Editor, visible at startup
         self._step_editor = StepEditor()
         self._detail_tabs.addTab(self._step_editor, "Step Details")
 
-        # Tab 2: Screenshot Viewer
-        self._screenshot_viewer = ScreenshotViewer()
-        self._detail_tabs.addTab(self._screenshot_viewer, "Screenshot")
-
-        # Tab 3: Code Editor
-        self._code_editor = CodeEditor()
-        self._detail_tabs.addTab(self._code_editor, "Code")
-
-        # Tab 4: Results
-        self._results_panel = ResultsPanel()
-        self._detail_tabs.addTab(self._results_panel, "Results")
+        # Tabs 2-4: empty hosts; the real widget is built when the tab is
+        # first shown or the window first needs it (see _detail_tab)
+        self._tab_factories = {
+            _TAB_SCREENSHOT: ScreenshotViewer,
+            _TAB_CODE: CodeEditor,
+            _TAB_RESULTS: ResultsPanel,
+        }
+        self._tab_widgets: dict[int, QWidget] = {}
+        for label in ("Screenshot", "Code", "Results"):
+            host = QWidget()
+            QVBoxLayout(host).setContentsMargins(0, 0, 0, 0)
+            self._detail_tabs.addTab(host, label)
+        self._detail_tabs.currentChanged.connect(self._detail_tab)
 
         right_layout.addWidget(self._detail_tabs)
         main_splitter.addWidget(right_panel)
@@ -120,6 +227,43 @@ class MainWindow(QMainWindow):
         main_splitter.setSizes([200, 550, 450])
         self.setCentralWidget(main_splitter)
 
+    def _detail_tab(self, index: int) -> QWidget | None:
+        """Return the widget for a detail tab, building it on first use."""
+        widget = self._tab_widgets.get(index)
+        if widget is None:
+            factory = self._tab_factories.get(index)
+            if factory is None:
+                return None
+            widget = factory()
+            self._detail_tabs.widget(index).layout().addWidget(widget)
+            self._tab_widgets[index] = widget
+        return widget
+
+    def _reset_detail_tabs(self) -> None:
+        """Clear every detail tab; tabs not built yet are already empty."""
+        self._step_editor.load_step(None)
+        code_editor = self._tab_widgets.get(_TAB_CODE)
+        if code_editor is not None:
+            code_editor.load_step(None)
+        screenshot_viewer = self._tab_widgets.get(_TAB_SCREENSHOT)
+        if screenshot_viewer is not None:
+            screenshot_viewer.clear()
+        results_panel = self._tab_widgets.get(_TAB_RESULTS)
+        if results_panel is not None:
+            results_panel.clear()
+
+    @property
+    def _screenshot_viewer(self) -> ScreenshotViewer:
+        return self._detail_tab(_TAB_SCREENSHOT)
+
+    @property
+    def _code_editor(self) -> CodeEditor:
+        return self._detail_tab(_TAB_CODE)
+
+    @property
+    def _results_panel(self) -> ResultsPanel:
+        return self._detail_tab(_TAB_RESULTS)
+
     def _setup_menu_bar(self) -> None:
         menu_bar = self.menuBar()
 
@@ -147,27 +291,33 @@ class MainWindow(QMainWindow):
         self._status_bar.showMessage("Ready - Open or create a project to begin")
 
     def _connect_signals(self) -> None:
+        # All of these widgets live on the GUI thread, so slots run inline
         # Toolbar
-        self._toolbar.record_clicked.connect(self._start_recording)
-        self._toolbar.stop_clicked.connect(self._stop_action)
-        self._toolbar.run_clicked.connect(self._run_test)
-        self._toolbar.run_all_clicked.connect(self._run_all_tests)
-        self._toolbar.save_clicked.connect(self._save_current_test)
+        self._toolbar.record_clicked.connect(self._start_recording, Qt.DirectConnection)
+        self._toolbar.stop_clicked.connect(self._stop_action, Qt.DirectConnection)
+        self._toolbar.run_clicked.connect(self._run_test, Qt.DirectConnection)
+        self._toolbar.run_all_clicked.connect(self._run_all_tests, Qt.DirectConnection)
+        self._toolbar.save_clicked.connect(self._save_current_test, Qt.DirectConnection)
 
         # Test explorer
-        self._test_explorer.test_selected.connect(self._load_test_file)
-        self._test_explorer.test_deleted.connect(self._on_test_deleted)
-        self._test_explorer.new_project_requested.connect(self._new_project)
-        self._test_explorer.open_project_requested.connect(self._open_project)
-        self._test_explorer.new_test_requested.connect(self._new_test)
+        self._test_explorer.test_selected.connect(self._load_test_file, Qt.DirectConnection)
+        self._test_explorer.test_deleted.connect(self._on_test_deleted, Qt.DirectConnection)
+        self._test_explorer.new_project_requested.connect(self._new_project, Qt.DirectConnection)
+        self._test_explorer.open_project_requested.connect(self._open_project, Qt.DirectConnection)
+        self._test_explorer.new_test_requested.connect(self._new_test, Qt.DirectConnection)
 
         # Step list
-        self._step_list.step_selected.connect(self._on_step_selected)
-        self._step_list.add_step_requested.connect(self._add_step)
-        self._step_list.delete_step_requested.connect(self._delete_step)
+        self._step_list.step_selected.connect(self._on_step_selected, Qt.DirectConnection)
+        self._step_list.add_step_requested.connect(self._add_step, Qt.DirectConnection)
+        self._step_list.delete_step_requested.connect(self._delete_step, Qt.DirectConnection)
 
         # Step editor
-        self._step_editor.pick_element_requested.connect(self._start_element_pick)
+        self._step_editor.pick_element_requested.connect(
+            self._start_element_pick, Qt.DirectConnection
+        )
+        self._step_editor.step_modified.connect(
+            self._step_list.model.update_step, Qt.DirectConnection
+        )
 
     # --- Engine / Recorder / Runner initialization ---
 
@@ -177,10 +327,8 @@ class MainWindow(QMainWindow):
             return True
 
         try:
-            from desktop_tester.core import get_platform_backend
-            from desktop_tester.core.engine import AutomationEngine
-            backend = get_platform_backend()
-            self._engine = AutomationEngine(backend)
+            backend = _lazy("desktop_tester.core", "get_platform_backend")()
+            self._engine = _lazy("desktop_tester.core.engine", "AutomationEngine")(backend)
             return True
         except Exception as e:
             QMessageBox.critical(
@@ -195,9 +343,9 @@ class MainWindow(QMainWindow):
         if not self._ensure_engine():
             return False
         if self._recorder is None:
-            from desktop_tester.recorder.recorder import RecordingSession
+            RecordingSession = _lazy("desktop_tester.recorder.recorder", "RecordingSession")
             self._recorder = RecordingSession(self._engine)
-            self._recorder.step_recorded.connect(self._on_step_recorded)
+            self._recorder.step_recorded.connect(self._on_step_recorded, Qt.QueuedConnection)
         return True
 
     def _ensure_runner(self) -> bool:
@@ -207,23 +355,27 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No Project", "Please open a project first.")
             return False
         if self._runner is None:
-            from desktop_tester.runner.runner import TestRunner
+            TestRunner = _lazy("desktop_tester.runner.runner", "TestRunner")
             self._runner = TestRunner(self._engine, self._project_dir, self._project_config)
-            self._runner.test_started.connect(self._on_test_started)
-            self._runner.step_started.connect(self._on_run_step_started)
-            self._runner.step_completed.connect(self._on_run_step_completed)
-            self._runner.test_completed.connect(self._on_test_completed)
+            # Emitted from the runner worker thread
+            self._runner.test_started.connect(self._on_test_started, Qt.QueuedConnection)
+            self._runner.step_started.connect(self._on_run_step_started, Qt.QueuedConnection)
+            self._runner.step_completed.connect(self._on_run_step_completed, Qt.QueuedConnection)
+            self._runner.test_completed.connect(self._on_test_completed, Qt.QueuedConnection)
         return True
 
     # --- Project operations ---
 
     def _new_project(self) -> None:
+        NewProjectDialog = _lazy("desktop_tester.gui.dialogs.new_project", "NewProjectDialog")
         apps = self._get_installed_apps()
         dialog = NewProjectDialog(apps=apps, parent=self)
         if dialog.exec() != NewProjectDialog.Accepted:
             return
 
-        project_dir = dialog.project_directory / dialog.project_name.replace(" ", "_").lower()
+        project_dir = Path(
+            dialog.project_directory_str, dialog.project_name.replace(" ", "_").lower()
+        )
         project_dir.mkdir(parents=True, exist_ok=True)
 
         # Build TargetApp from selection or manual text entry
@@ -269,11 +421,12 @@ class MainWindow(QMainWindow):
 
         self._project_dir = project_dir
         self._project_config = load_project(config_path)
+        self._tests_path = project_dir / self._project_config.tests_dir
+        self._reports_path = project_dir / self._project_config.reports_dir
         self._runner = None  # Reset runner with new config
 
         # Remember this project for next launch
-        settings = QSettings("DesktopTester", "DesktopTester")
-        settings.setValue("last_project_dir", str(project_dir))
+        self._settings.setValue("last_project_dir", str(project_dir))
 
         self._test_explorer.load_project(project_dir, self._project_config.tests_dir)
         self.setWindowTitle(f"{APP_NAME} - {self._project_config.name}")
@@ -284,7 +437,7 @@ class MainWindow(QMainWindow):
         if target_name and self._try_connect_saved_app(launch=False):
             self._status_bar.showMessage(
                 f"Opened project: {self._project_config.name} "
-                f"(connected to {target.name or target.bundle_id})"
+                f"(connected to {target_name})"
             )
         elif target_name:
             self._status_bar.showMessage(
@@ -297,34 +450,47 @@ class MainWindow(QMainWindow):
     # --- Test file operations ---
 
     def _load_test_file(self, path: Path) -> None:
-        """Load a test YAML file into the step list."""
+        """Load a test YAML file into the step list.
+
+        The file is parsed off the GUI thread; _on_test_file_loaded applies it.
+        """
+        self._open_request = self._test_loader.load(path)
+        self._status_bar.showMessage(f"Loading: {path.name}...")
+
+    def _on_test_file_failed(self, request_id: int, path: Path, error: str) -> None:
+        if request_id != self._open_request:
+            return
+        QMessageBox.warning(self, "Load Error", f"Failed to load test:\n{error}")
+
+    def _on_test_file_loaded(self, request_id: int, path: Path, test_data: dict) -> None:
+        if request_id != self._open_request:
+            return  # A later selection superseded this one
+
+        # Repaint once for the whole reset instead of once per widget
+        self.setUpdatesEnabled(False)
         try:
-            test_data = load_test_file(path)
             self._current_test_path = path
             steps = test_data.get("steps", [])
             self._step_list.model.set_steps(steps)
             self._step_list.set_status(
                 f"{test_data['name']} - {len(steps)} steps"
             )
-            self._results_panel.clear()
-            self._step_editor.load_step(None)
-            self._code_editor.load_step(None)
-            self._screenshot_viewer.clear()
+            self._reset_detail_tabs()
             self._status_bar.showMessage(f"Loaded: {path.name}")
-        except Exception as e:
-            QMessageBox.warning(self, "Load Error", f"Failed to load test:\n{e}")
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _new_test(self) -> None:
         if not self._project_dir or not self._project_config:
             QMessageBox.warning(self, "No Project", "Please open a project first.")
             return
 
+        NewTestDialog = _lazy("desktop_tester.gui.dialogs.new_test", "NewTestDialog")
         dialog = NewTestDialog(self)
         if dialog.exec() != NewTestDialog.Accepted:
             return
 
-        tests_dir = self._project_dir / self._project_config.tests_dir
-        test_path = tests_dir / dialog.filename
+        test_path = self._tests_path / dialog.filename
 
         save_test_file(
             test_path,
@@ -333,7 +499,7 @@ class MainWindow(QMainWindow):
             description=dialog.description,
         )
 
-        self._test_explorer.load_project(self._project_dir, self._project_config.tests_dir)
+        self._test_explorer.add_test(test_path)
         self._load_test_file(test_path)
         self._status_bar.showMessage(f"Created test: {dialog.test_name}")
 
@@ -352,21 +518,13 @@ class MainWindow(QMainWindow):
 
     def _on_test_deleted(self, path: Path) -> None:
         """Handle a test file being deleted from the explorer."""
-        # Refresh the tree
-        if self._project_dir and self._project_config:
-            self._test_explorer.load_project(
-                self._project_dir, self._project_config.tests_dir
-            )
-
+        # The explorer has already dropped the row
         # Clear the editor if the deleted test was the one loaded
         if self._current_test_path and self._current_test_path == path:
             self._current_test_path = None
             self._step_list.model.set_steps([])
             self._step_list.set_status("No test loaded")
-            self._step_editor.load_step(None)
-            self._code_editor.load_step(None)
-            self._results_panel.clear()
-            self._screenshot_viewer.clear()
+            self._reset_detail_tabs()
 
         self._status_bar.showMessage(f"Deleted: {path.name}")
 
@@ -391,7 +549,7 @@ class MainWindow(QMainWindow):
         self._step_list.set_status(f"{len(existing) + 1} steps")
         # Select the new step and open the editor
         self._on_step_selected(len(existing))
-        self._detail_tabs.setCurrentWidget(self._step_editor)
+        self._detail_tabs.setCurrentIndex(_TAB_STEP)
 
     def _delete_step(self, row: int) -> None:
         """Delete the step at the given row."""
@@ -405,7 +563,6 @@ class MainWindow(QMainWindow):
 
     def _start_element_pick(self) -> None:
         """Enter element-pick mode: the next click in the target app selects an element."""
-        import sys
         if sys.platform != "darwin":
             self._step_editor.cancel_pick()
             return
@@ -414,7 +571,8 @@ class MainWindow(QMainWindow):
             self._step_editor.cancel_pick()
             return
 
-        import Cocoa
+        Cocoa = _lazy("Cocoa")
+        self._main_screen_height()
 
         self._status_bar.showMessage("Pick mode: click an element in the target app...")
 
@@ -425,9 +583,30 @@ class MainWindow(QMainWindow):
             )
         )
 
+    def _main_screen_height(self) -> float | None:
+        """Return the main screen height, cached until the display layout changes."""
+        if self._screen_height is None:
+            Cocoa = _lazy("Cocoa")
+            screen = Cocoa.NSScreen.mainScreen()
+            if screen is None:
+                return None
+            self._screen_height = screen.frame().size.height
+            if self._screen_observer is None:
+                center = Cocoa.NSNotificationCenter.defaultCenter()
+                self._screen_observer = center.addObserverForName_object_queue_usingBlock_(
+                    Cocoa.NSApplicationDidChangeScreenParametersNotification,
+                    None,
+                    None,
+                    self._invalidate_screen_height,
+                )
+        return self._screen_height
+
+    def _invalidate_screen_height(self, _notification) -> None:
+        self._screen_height = None
+
     def _on_element_picked(self, ns_event) -> None:
         """Handle the pick-mode click: resolve the element and populate the editor."""
-        import Cocoa
+        Cocoa = _lazy("Cocoa")
 
         # Remove the monitor immediately (one-shot)
         if self._pick_monitor is not None:
@@ -437,18 +616,16 @@ class MainWindow(QMainWindow):
         try:
             # Convert Cocoa coordinates (bottom-left origin) to screen (top-left)
             loc = Cocoa.NSEvent.mouseLocation()
-            screen = Cocoa.NSScreen.mainScreen()
-            if screen is None:
+            screen_height = self._main_screen_height()
+            if screen_height is None:
                 self._step_editor.cancel_pick()
                 self._status_bar.showMessage("Pick cancelled")
                 return
-            screen_height = screen.frame().size.height
             x = int(loc.x)
             y = int(screen_height - loc.y)
 
             # Resolve the element at the click position
-            from desktop_tester.recorder.element_resolver import ElementResolver
-
+            ElementResolver = _lazy("desktop_tester.recorder.element_resolver", "ElementResolver")
             resolver = ElementResolver(self._engine)
             element, locator = resolver.resolve(x, y)
 
@@ -463,8 +640,9 @@ class MainWindow(QMainWindow):
 
             self._step_editor.set_picked_element(locator_dict, element_value)
 
-            desc = element.title or element.label or element.identifier or element.role
-            self._status_bar.showMessage(f"Picked: {desc} ({element.role}) = \"{element_value}\"")
+            role = element.role
+            desc = element.title or element.label or element.identifier or role
+            self._status_bar.showMessage(f"Picked: {desc} ({role}) = \"{element_value}\"")
 
         except Exception as e:
             self._step_editor.cancel_pick()
@@ -482,6 +660,7 @@ class MainWindow(QMainWindow):
                 return
 
         self._step_list.model.set_steps([])
+        self._pending_steps.clear()
         self._results_panel.clear()
         self._recorder.start()
         self._toolbar.set_recording_state(True)
@@ -500,6 +679,7 @@ class MainWindow(QMainWindow):
             return
 
         steps = self._recorder.stop()
+        self._pending_steps.clear()  # set_steps() below includes them
         self._step_list.model.set_steps(steps)
         self._toolbar.set_recording_state(False)
         self._step_list.set_status(f"Recorded {len(steps)} steps")
@@ -509,7 +689,16 @@ class MainWindow(QMainWindow):
 
     def _on_step_recorded(self, step: Step) -> None:
         """Called when a new step is captured during recording."""
-        self._step_list.model.add_step(step)
+        self._pending_steps.append(step)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(_RECORD_FLUSH_MS, self._flush_recorded_steps)
+
+    def _flush_recorded_steps(self) -> None:
+        """Add the steps recorded since the last flush in one model update."""
+        self._flush_scheduled = False
+        batch, self._pending_steps = self._pending_steps, []
+        self._step_list.model.add_steps(batch)
 
     # --- Test execution ---
 
@@ -528,14 +717,14 @@ class MainWindow(QMainWindow):
         self._step_list.model.clear_results()
         self._results_panel.clear()
         self._toolbar.set_running_state(True)
-        self._detail_tabs.setCurrentWidget(self._results_panel)
+        self._detail_tabs.setCurrentIndex(_TAB_RESULTS)
         self._status_bar.showMessage("Running test...")
 
-        from desktop_tester.runner.runner import TestRunnerWorker
+        TestRunnerWorker = _lazy("desktop_tester.runner.runner", "TestRunnerWorker")
         self._runner_worker = TestRunnerWorker(
             self._runner, [self._current_test_path]
         )
-        self._runner_worker.finished.connect(self._on_run_finished)
+        self._runner_worker.finished.connect(self._on_run_finished, Qt.QueuedConnection)
         self._runner_worker.start()
 
     def _run_all_tests(self) -> None:
@@ -549,8 +738,8 @@ class MainWindow(QMainWindow):
             if not self._ensure_connected():
                 return
 
-        tests_dir = self._project_dir / self._project_config.tests_dir
-        test_paths = sorted(tests_dir.glob("*.yaml"))
+        # The explorer's watcher already tracks the tests directory
+        test_paths = self._test_explorer.test_files()
 
         if not test_paths:
             self._status_bar.showMessage("No test files found")
@@ -558,27 +747,35 @@ class MainWindow(QMainWindow):
 
         self._results_panel.clear()
         self._toolbar.set_running_state(True)
-        self._detail_tabs.setCurrentWidget(self._results_panel)
+        self._detail_tabs.setCurrentIndex(_TAB_RESULTS)
         self._status_bar.showMessage(f"Running {len(test_paths)} tests...")
 
-        from desktop_tester.runner.runner import TestRunnerWorker
+        TestRunnerWorker = _lazy("desktop_tester.runner.runner", "TestRunnerWorker")
         self._runner_worker = TestRunnerWorker(self._runner, test_paths)
-        self._runner_worker.finished.connect(self._on_run_finished)
+        self._runner_worker.finished.connect(self._on_run_finished, Qt.QueuedConnection)
         self._runner_worker.start()
 
-    def _on_test_started(self, test_name: str, test_path: str) -> None:
+    def _on_test_started(self, test_name: str, test_path: Path) -> None:
         self._results_panel.add_test_header(test_name)
-        # Load the test steps into the step list so the command log shows them
-        path = Path(test_path)
-        try:
-            test_data = load_test_file(path)
-            self._current_test_path = path
-            steps = test_data.get("steps", [])
-            self._step_list.model.set_steps(steps)
+        # A test run from the editor already has its steps in the list
+        if test_path == self._current_test_path and self._step_list.model.rowCount():
             self._step_list.model.clear_results()
             self._step_list.set_status(f"Running: {test_name}")
-        except Exception:
-            pass
+            return
+
+        # Load the test steps into the step list so the command log shows them.
+        # The runner has just parsed this file, so only a race with an edit fails.
+        if not test_path.exists():
+            return
+        try:
+            test_data = load_test_file(test_path)
+        except (OSError, KeyError, ValueError, yaml.YAMLError) as e:
+            self._status_bar.showMessage(f"Failed to reload steps: {e}")
+            return
+        self._current_test_path = test_path
+        self._step_list.model.set_steps(test_data.get("steps", []))
+        self._step_list.model.clear_results()
+        self._step_list.set_status(f"Running: {test_name}")
 
     def _on_run_step_started(self, step_id: str) -> None:
         self._step_list.model.set_current_step(step_id)
@@ -602,50 +799,64 @@ class MainWindow(QMainWindow):
             summary = self._runner_worker.summary
             self._results_panel.set_run_summary(summary)
 
-            # Generate HTML report
-            report_path = self._generate_html_report(summary)
-            if report_path:
+            if self._generate_html_report(summary):
                 self._status_bar.showMessage(
-                    f"Run complete: {summary.passed}/{summary.total} passed "
-                    f"({summary.duration_ms:.0f}ms) - Report: {report_path.name}"
+                    f"{self._run_summary_message(summary)} - Generating report..."
                 )
             else:
-                self._status_bar.showMessage(
-                    f"Run complete: {summary.passed}/{summary.total} passed "
-                    f"({summary.duration_ms:.0f}ms)"
-                )
+                self._status_bar.showMessage(self._run_summary_message(summary))
         else:
             self._status_bar.showMessage("Run complete")
 
+    @staticmethod
+    def _run_summary_message(summary) -> str:
+        return (
+            f"Run complete: {summary.passed}/{summary.total} passed "
+            f"({summary.duration_ms:.0f}ms)"
+        )
+
     def _generate_html_report(self, summary) -> Path | None:
-        """Generate an HTML report and return the path, or None on failure."""
+        """Start writing an HTML report and return its path, or None on failure.
+
+        The report is rendered off the GUI thread; _on_report_written or
+        _on_report_failed reports the outcome.
+        """
         if not self._project_dir or not self._project_config:
             return None
         try:
-            from datetime import datetime
-
-            from desktop_tester.reporter.reporter import ReportGenerator
-
-            report_dir = self._project_dir / self._project_config.reports_dir
-            report_dir.mkdir(parents=True, exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            report_path = report_dir / f"report_{timestamp}.html"
-
-            generator = ReportGenerator()
-            generator.generate_html(summary, report_path)
+            self._reports_path.mkdir(parents=True, exist_ok=True)
+            timestamp = datetime.now().strftime(_REPORT_TIMESTAMP_FMT)
+            report_path = self._reports_path / f"report_{timestamp}.html"
+            self._report_writer.write(summary, report_path)
             return report_path
         except Exception:
             return None
 
+    def _on_report_written(self, summary, report_path: Path) -> None:
+        self._status_bar.showMessage(
+            f"{self._run_summary_message(summary)} - Report: {report_path.name}"
+        )
+
+    def _on_report_failed(self, summary, _error: str) -> None:
+        self._status_bar.showMessage(self._run_summary_message(summary))
+
     # --- Target app selection ---
 
     def _get_installed_apps(self) -> list[dict]:
-        """Return installed applications, falling back to an empty list."""
+        """Return installed applications, falling back to an empty list.
+
+        The scan walks the Applications folders, so its result is reused
+        for _INSTALLED_APPS_TTL seconds.
+        """
+        now = time.monotonic()
+        if self._apps_cache is not None and now - self._apps_cache[0] < _INSTALLED_APPS_TTL:
+            return self._apps_cache[1]
         try:
-            import sys
             if sys.platform == "darwin":
-                from desktop_tester.core.macos_backend import MacOSBackend
-                return MacOSBackend.list_installed_applications()
+                MacOSBackend = _lazy("desktop_tester.core.macos_backend", "MacOSBackend")
+                apps = MacOSBackend.list_installed_applications()
+                self._apps_cache = (now, apps)
+                return apps
         except Exception:
             pass
         return []
@@ -661,8 +872,15 @@ class MainWindow(QMainWindow):
             identifier = app.get("bundle_id") or app.get("name") or str(app.get("pid"))
             try:
                 self._engine.attach_to_app(identifier)
+                self._connected_identifier = identifier
                 self._status_bar.showMessage(f"Connected to: {app.get('name')}")
 
+                # An app missing from the cached scan was installed since; rescan next time
+                if self._apps_cache is not None and app.get("bundle_id") not in {
+                    a.get("bundle_id") for a in self._apps_cache[1]
+                }:
+                    self._apps_cache = None
+
                 # Save selection to project config
                 if self._project_config and self._project_dir:
                     self._project_config.target_app.name = app.get("name", "")
@@ -686,12 +904,15 @@ class MainWindow(QMainWindow):
         identifier = target.bundle_id or target.name
         if not identifier:
             return False
+        if self._engine.app_ref and self._connected_identifier == identifier:
+            return True
 
         try:
             if launch:
                 self._engine.connect_or_launch(target)
             else:
                 self._engine.attach_to_app(identifier)
+            self._connected_identifier = identifier
             self._status_bar.showMessage(
                 f"Connected to: {target.name or identifier}"
             )
@@ -0,0 +1,102 @@
+"""Qt Model for the results panel list view."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+from desktop_tester.models.step import StepResult
+
+
+@dataclass(slots=True)
+class ResultGroup:
+    """Header row for one test; its step results follow it in the list."""
+
+    test_name: str
+    status: str = "running"
+    detail: str = "RUNNING..."
+    collapsed: bool = False
+
+
+class ResultListModel(QAbstractListModel):
+    """Flat list of test group headers, each followed by its step results."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[ResultGroup | StepResult] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return len(self._rows)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+
+        entry = self._rows[index.row()]
+
+        if role == Qt.DisplayRole:
+            if isinstance(entry, ResultGroup):
+                return entry.test_name
+            return entry.step_id
+
+        elif role == Qt.ToolTipRole:
+            if isinstance(entry, StepResult):
+                return entry.error_message
+            return None
+
+        elif role == Qt.UserRole:
+            return entry
+
+        return None
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._rows = []
+        self.endResetModel()
+
+    def add_group(self, test_name: str) -> int:
+        """Append a group header and return its row."""
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(ResultGroup(test_name))
+        self.endInsertRows()
+        return row
+
+    def add_results(self, results: list[StepResult]) -> range:
+        """Append step results with one row-insertion notification."""
+        first = len(self._rows)
+        if results:
+            self.beginInsertRows(QModelIndex(), first, first + len(results) - 1)
+            self._rows.extend(results)
+            self.endInsertRows()
+        return range(first, len(self._rows))
+
+    def group_at(self, row: int) -> ResultGroup | None:
+        entry = self._rows[row] if 0 <= row < len(self._rows) else None
+        return entry if isinstance(entry, ResultGroup) else None
+
+    def group_rows(self, row: int) -> range:
+        """Rows of the step results under the group header at *row*."""
+        end = row + 1
+        while end < len(self._rows) and not isinstance(self._rows[end], ResultGroup):
+            end += 1
+        return range(row + 1, end)
+
+    def set_group_result(self, row: int, status: str, detail: str) -> None:
+        """Record a group's final status and refresh its header row."""
+        group = self.group_at(row)
+        if group is None:
+            return
+        group.status = status
+        group.detail = detail
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.UserRole])
+
+    def set_group_collapsed(self, row: int, collapsed: bool) -> None:
+        group = self.group_at(row)
+        if group is None:
+            return
+        group.collapsed = collapsed
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.UserRole])
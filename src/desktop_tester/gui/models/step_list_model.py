@@ -2,11 +2,31 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, QTimer
 from PySide6.QtGui import QColor
 
 from desktop_tester.models.step import Step, StepResult
 
+# Row changes made within one frame are reported to views together
+_CHANGE_FLUSH_MS = 16
+
+_STATUS_ROLES = [Qt.DisplayRole, Qt.ForegroundRole, Qt.BackgroundRole]
+
+_STATUS_ICONS = {
+    "passed": "[PASS]",
+    "failed": "[FAIL]",
+    "error": "[ERR]",
+    "skipped": "[SKIP]",
+    "running": "[RUNNING]",
+}
+
+# Shared brushes returned from data(); views copy them, so one instance suffices
+_COLOR_PASSED_FG = QColor(76, 175, 80)  # Green
+_COLOR_FAILED_FG = QColor(244, 67, 54)  # Red
+_COLOR_ERROR_FG = QColor(255, 152, 0)  # Orange
+_COLOR_RUNNING_FG = QColor(42, 130, 218)  # Blue
+_COLOR_RUNNING_BG = QColor(42, 42, 60)
+
 
 class StepListModel(QAbstractListModel):
     """Model backing the step list / command log view."""
@@ -14,8 +34,19 @@ class StepListModel(QAbstractListModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._steps: list[Step] = []
+        self._id_to_row: dict[str, int] = {}
         self._results: dict[str, StepResult] = {}
         self._current_step_id: str = ""
+        # row -> (status, display text); a status change misses the cache.
+        # Keyed by row because step ids need not be unique.
+        self._display_cache: dict[int, tuple[str, str]] = {}
+
+        # Rows whose status changed since the last dataChanged emission
+        self._dirty_rows: set[int] = set()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_CHANGE_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush_dirty_rows)
 
     def rowCount(self, parent=QModelIndex()) -> int:
         return len(self._steps)
@@ -27,32 +58,38 @@ class StepListModel(QAbstractListModel):
         step = self._steps[index.row()]
 
         if role == Qt.DisplayRole:
-            prefix = f"{index.row() + 1}. "
             result = self._results.get(step.id)
             if result:
-                status_icon = {"passed": "[PASS]", "failed": "[FAIL]", "error": "[ERR]",
-                               "skipped": "[SKIP]"}.get(result.status, "")
-                return f"{prefix}{step.description or step.action.value}  {status_icon}"
+                status = result.status
             elif step.id == self._current_step_id:
-                return f"{prefix}{step.description or step.action.value}  [RUNNING]"
-            return f"{prefix}{step.description or step.action.value}"
+                status = "running"
+            else:
+                status = ""
+            cached = self._display_cache.get(index.row())
+            if cached is not None and cached[0] == status:
+                return cached[1]
+            text = f"{index.row() + 1}. {step.description or step.action.value}"
+            if status:
+                text = f"{text}  {_STATUS_ICONS.get(status, '')}"
+            self._display_cache[index.row()] = (status, text)
+            return text
 
         elif role == Qt.ForegroundRole:
             result = self._results.get(step.id)
             if result:
                 if result.status == "passed":
-                    return QColor(76, 175, 80)  # Green
+                    return _COLOR_PASSED_FG
                 elif result.status == "failed":
-                    return QColor(244, 67, 54)  # Red
+                    return _COLOR_FAILED_FG
                 elif result.status == "error":
-                    return QColor(255, 152, 0)  # Orange
+                    return _COLOR_ERROR_FG
             if step.id == self._current_step_id:
-                return QColor(42, 130, 218)  # Blue
+                return _COLOR_RUNNING_FG
             return None
 
         elif role == Qt.BackgroundRole:
             if step.id == self._current_step_id:
-                return QColor(42, 42, 60)
+                return _COLOR_RUNNING_BG
             return None
 
         elif role == Qt.UserRole:
@@ -64,8 +101,11 @@ class StepListModel(QAbstractListModel):
         """Replace all steps."""
         self.beginResetModel()
         self._steps = list(steps)
+        self._id_to_row = {step.id: i for i, step in enumerate(self._steps)}
         self._results.clear()
         self._current_step_id = ""
+        self._display_cache.clear()
+        self._dirty_rows.clear()
         self.endResetModel()
 
     def add_step(self, step: Step) -> None:
@@ -73,6 +113,20 @@ class StepListModel(QAbstractListModel):
         row = len(self._steps)
         self.beginInsertRows(QModelIndex(), row, row)
         self._steps.append(step)
+        self._id_to_row[step.id] = row
+        self._display_cache.clear()
+        self.endInsertRows()
+
+    def add_steps(self, steps: list[Step]) -> None:
+        """Append several steps with a single row-insertion notification."""
+        if not steps:
+            return
+        first = len(self._steps)
+        self.beginInsertRows(QModelIndex(), first, first + len(steps) - 1)
+        self._steps.extend(steps)
+        for i, step in enumerate(steps, first):
+            self._id_to_row[step.id] = i
+        self._display_cache.clear()
         self.endInsertRows()
 
     def remove_step(self, row: int) -> None:
@@ -81,8 +135,22 @@ class StepListModel(QAbstractListModel):
             self.beginRemoveRows(QModelIndex(), row, row)
             removed = self._steps.pop(row)
             self._results.pop(removed.id, None)
+            # Removals are rare; renumber the rows that shifted up
+            self._id_to_row.pop(removed.id, None)
+            for i in range(row, len(self._steps)):
+                self._id_to_row[self._steps[i].id] = i
+            self._display_cache.clear()
             self.endRemoveRows()
 
+    def update_step(self, step: Step) -> None:
+        """Refresh the row of a step that was edited in place."""
+        row = self._row_of(step.id)
+        if row < 0 or self._steps[row] is not step:
+            # Shared or missing id; find the edited object itself
+            row = next((i for i, s in enumerate(self._steps) if s is step), -1)
+        self._display_cache.pop(row, None)
+        self._mark_dirty(row)
+
     def get_step(self, row: int) -> Step | None:
         if 0 <= row < len(self._steps):
             return self._steps[row]
@@ -93,27 +161,55 @@ class StepListModel(QAbstractListModel):
 
     def set_current_step(self, step_id: str) -> None:
         """Mark a step as currently running."""
+        # Only the previous and the new current rows change appearance
+        self._mark_dirty(self._row_of(self._current_step_id))
         self._current_step_id = step_id
-        self.dataChanged.emit(
-            self.index(0), self.index(len(self._steps) - 1),
-            [Qt.DisplayRole, Qt.ForegroundRole, Qt.BackgroundRole],
-        )
+        self._mark_dirty(self._row_of(step_id))
 
     def set_step_result(self, result: StepResult) -> None:
         """Set the result for a completed step."""
         self._results[result.step_id] = result
-        # Find the row and emit change
-        for i, step in enumerate(self._steps):
-            if step.id == result.step_id:
-                idx = self.index(i)
-                self.dataChanged.emit(idx, idx, [Qt.DisplayRole, Qt.ForegroundRole])
-                break
+        self._mark_dirty(self._row_of(result.step_id))
+
+    def _row_of(self, step_id: str) -> int:
+        """Row of the step with *step_id*, or -1."""
+        return self._id_to_row.get(step_id, -1)
+
+    def _mark_dirty(self, row: int) -> None:
+        """Queue a row for the next coalesced dataChanged emission."""
+        if row < 0:
+            return
+        self._dirty_rows.add(row)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_dirty_rows(self) -> None:
+        """Emit one dataChanged per contiguous run of changed rows."""
+        rows = sorted(r for r in self._dirty_rows if r < len(self._steps))
+        self._dirty_rows.clear()
+        i = 0
+        while i < len(rows):
+            j = i
+            while j + 1 < len(rows) and rows[j + 1] == rows[j] + 1:
+                j += 1
+            self.dataChanged.emit(self.index(rows[i]), self.index(rows[j]), _STATUS_ROLES)
+            i = j + 1
 
     def clear_results(self) -> None:
         """Clear all results (before a new run)."""
+        changed = [
+            i for i, step in enumerate(self._steps)
+            if step.id in self._results or step.id == self._current_step_id
+        ]
         self._results.clear()
         self._current_step_id = ""
-        self.dataChanged.emit(
-            self.index(0), self.index(len(self._steps) - 1),
-            [Qt.DisplayRole, Qt.ForegroundRole, Qt.BackgroundRole],
-        )
+        if len(changed) > len(self._steps) // 2:
+            # Most rows changed; one range is cheaper than many small ones
+            self._dirty_rows.clear()
+            self._flush_timer.stop()
+            self.dataChanged.emit(
+                self.index(0), self.index(len(self._steps) - 1), _STATUS_ROLES
+            )
+            return
+        for row in changed:
+            self._mark_dirty(row)
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import bisect
 from pathlib import Path
 
 from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt
 from PySide6.QtGui import QColor
 
+from desktop_tester.models.serialization import list_test_files
+
+# Shared brushes returned from data(); views copy them, so one instance suffices
+_COLOR_PASSED_FG = QColor(76, 175, 80)
+_COLOR_FAILED_FG = QColor(244, 67, 54)
+_COLOR_ERROR_FG = QColor(255, 152, 0)
+
 
 class TestFileItem:
     """A node in the test explorer tree."""
@@ -17,11 +25,26 @@ class TestFileItem:
         self.parent = parent
         self.children: list[TestFileItem] = []
         self.status: str = ""  # "", "passed", "failed", "error"
+        self._row = 0  # Index in parent.children, kept current by the parent
 
     def append_child(self, child: TestFileItem) -> None:
         child.parent = self
+        child._row = len(self.children)
         self.children.append(child)
 
+    def insert_child(self, row: int, child: TestFileItem) -> None:
+        child.parent = self
+        self.children.insert(row, child)
+        self._renumber(row)
+
+    def remove_child(self, row: int) -> None:
+        del self.children[row]
+        self._renumber(row)
+
+    def _renumber(self, start: int) -> None:
+        for i in range(start, len(self.children)):
+            self.children[i]._row = i
+
     def child(self, row: int) -> TestFileItem | None:
         if 0 <= row < len(self.children):
             return self.children[row]
@@ -31,9 +54,7 @@ class TestFileItem:
         return len(self.children)
 
     def row(self) -> int:
-        if self.parent:
-            return self.parent.children.index(self)
-        return 0
+        return self._row
 
 
 class TestTreeModel(QAbstractItemModel):
@@ -42,23 +63,67 @@ class TestTreeModel(QAbstractItemModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._root = TestFileItem("Root")
+        self._path_to_item: dict[Path, TestFileItem] = {}
+        self._project_dir: Path | None = None
 
     def load_project(self, project_dir: Path, tests_dir_name: str = "tests") -> None:
         """Scan the tests directory and build the tree."""
         self.beginResetModel()
         self._root = TestFileItem("Root")
+        self._path_to_item = {}
+        self._project_dir = project_dir
 
         tests_dir = project_dir / tests_dir_name
         if tests_dir.is_dir():
             project_item = TestFileItem(project_dir.name, project_dir)
             self._root.append_child(project_item)
 
-            for test_file in sorted(tests_dir.glob("*.yaml")):
+            for test_file in list_test_files(tests_dir):
                 item = TestFileItem(test_file.stem, test_file)
                 project_item.append_child(item)
+                self._path_to_item[test_file] = item
 
         self.endResetModel()
 
+    def add_test(self, test_path: Path) -> None:
+        """Insert a single test file node, keeping the files sorted."""
+        if test_path in self._path_to_item:
+            return
+        project_item = self._root.child(0)
+        if project_item is None:
+            # The tests dir did not exist when the project was loaded
+            if self._project_dir is None:
+                return
+            self.beginInsertRows(QModelIndex(), 0, 0)
+            project_item = TestFileItem(self._project_dir.name, self._project_dir)
+            self._root.append_child(project_item)
+            self.endInsertRows()
+        paths = [child.path for child in project_item.children]
+        row = bisect.bisect(paths, test_path)
+        parent_index = self.createIndex(project_item.row(), 0, project_item)
+        self.beginInsertRows(parent_index, row, row)
+        item = TestFileItem(test_path.stem, test_path)
+        project_item.insert_child(row, item)
+        self._path_to_item[test_path] = item
+        self.endInsertRows()
+
+    def remove_test(self, test_path: Path) -> None:
+        """Remove the node for a single test file, if present."""
+        item = self._path_to_item.get(test_path)
+        if item is None:
+            return
+        project_item = item.parent
+        row = item.row()
+        parent_index = self.createIndex(project_item.row(), 0, project_item)
+        self.beginRemoveRows(parent_index, row, row)
+        project_item.remove_child(row)
+        del self._path_to_item[test_path]
+        self.endRemoveRows()
+
+    def test_paths(self) -> list[Path]:
+        """Paths of the test files currently in the tree."""
+        return list(self._path_to_item)
+
     def index(self, row: int, column: int = 0, parent=QModelIndex()) -> QModelIndex:
         if not self.hasIndex(row, column, parent):
             return QModelIndex()
@@ -104,11 +169,11 @@ class TestTreeModel(QAbstractItemModel):
 
         elif role == Qt.ForegroundRole:
             if item.status == "passed":
-                return QColor(76, 175, 80)
+                return _COLOR_PASSED_FG
             elif item.status == "failed":
-                return QColor(244, 67, 54)
+                return _COLOR_FAILED_FG
             elif item.status == "error":
-                return QColor(255, 152, 0)
+                return _COLOR_ERROR_FG
             return None
 
         elif role == Qt.UserRole:
@@ -123,16 +188,12 @@ class TestTreeModel(QAbstractItemModel):
 
     def set_test_status(self, test_path: Path, status: str) -> None:
         """Update the status of a test file node."""
-        self._update_status(self._root, test_path, status)
-
-    def _update_status(self, item: TestFileItem, test_path: Path, status: str) -> bool:
-        if item.path and item.path == test_path:
-            item.status = status
-            return True
-        for child in item.children:
-            if self._update_status(child, test_path, status):
-                return True
-        return False
+        item = self._path_to_item.get(test_path)
+        if item is None:
+            return
+        item.status = status
+        index = self.createIndex(item.row(), 0, item)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.ForegroundRole])
 
     def get_file_path(self, index: QModelIndex) -> Path | None:
         if not index.isValid():
@@ -3,13 +3,24 @@
 from __future__ import annotations
 
 import yaml
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QTimer, Signal
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import QPlainTextEdit, QVBoxLayout, QWidget
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper
+
 from desktop_tester.models.serialization import step_to_dict
 from desktop_tester.models.step import Step
 
+# Serialized steps kept for re-selection; oldest entries are evicted first
+_YAML_CACHE_SIZE = 64
+
+# Quiet period after the last keystroke before code_modified is emitted
+_CODE_MODIFIED_DELAY_MS = 150
+
 
 class CodeEditor(QWidget):
     """Raw YAML editor for test steps."""
@@ -39,28 +50,85 @@ class CodeEditor(QWidget):
 
         layout.addWidget(self._editor)
         self._updating = False
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(_CODE_MODIFIED_DELAY_MS)
+        self._emit_timer.timeout.connect(self._emit_modified)
+        # Step selected while hidden; serialized when the editor is shown
+        self._pending_step: Step | None = None
+        self._pending_dirty = False
+        # repr of the step dict -> YAML. Steps are edited in place, so the key
+        # covers the content rather than the step id.
+        self._yaml_cache: dict[str, str] = {}
 
     def load_step(self, step: Step | None) -> None:
-        """Display the YAML for a step."""
+        """Display the YAML for a step.
+
+        While the editor is hidden the step is only remembered, and its YAML
+        is produced on the next show.
+        """
+        if not self.isVisible():
+            self._pending_step = step
+            self._pending_dirty = True
+            return
+        self._show_step(step)
+
+    def showEvent(self, event) -> None:
+        self._flush_pending()
+        super().showEvent(event)
+
+    def _flush_pending(self) -> None:
+        if self._pending_dirty:
+            step = self._pending_step
+            self._pending_step = None
+            self._pending_dirty = False
+            self._show_step(step)
+
+    def _show_step(self, step: Step | None) -> None:
+        self._flush_modified()
         self._updating = True
         if step is None:
             self._editor.setPlainText("")
         else:
-            step_dict = step_to_dict(step)
-            yaml_str = yaml.dump(step_dict, default_flow_style=False, sort_keys=False)
-            self._editor.setPlainText(yaml_str)
+            self._editor.setPlainText(self._step_yaml(step))
         self._updating = False
 
+    def _step_yaml(self, step: Step) -> str:
+        step_dict = step_to_dict(step)
+        key = repr(step_dict)
+        yaml_str = self._yaml_cache.get(key)
+        if yaml_str is None:
+            yaml_str = yaml.dump(
+                step_dict, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False
+            )
+            if len(self._yaml_cache) >= _YAML_CACHE_SIZE:
+                del self._yaml_cache[next(iter(self._yaml_cache))]
+            self._yaml_cache[key] = yaml_str
+        return yaml_str
+
     def load_yaml(self, yaml_str: str) -> None:
         """Load raw YAML text."""
+        self._pending_step = None
+        self._pending_dirty = False
+        self._flush_modified()
         self._updating = True
         self._editor.setPlainText(yaml_str)
         self._updating = False
 
     def get_yaml(self) -> str:
         """Get the current YAML text."""
+        self._flush_pending()
         return self._editor.toPlainText()
 
     def _on_text_changed(self) -> None:
         if not self._updating:
-            self.code_modified.emit(self._editor.toPlainText())
+            self._emit_timer.start()
+
+    def _flush_modified(self) -> None:
+        """Deliver a pending edit before the buffer is replaced."""
+        if self._emit_timer.isActive():
+            self._emit_timer.stop()
+            self._emit_modified()
+
+    def _emit_modified(self) -> None:
+        self.code_modified.emit(self._editor.toPlainText())
@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QRect, QSize, Qt, QTimer
+from PySide6.QtGui import QColor, QFont
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QLabel,
-    QScrollArea,
+    QListView,
+    QStyledItemDelegate,
     QVBoxLayout,
     QWidget,
-    QHBoxLayout,
-    QFrame,
 )
 
-from desktop_tester.models.step import StepResult, TestResult, RunSummary
+from desktop_tester.gui.models.result_list_model import ResultGroup, ResultListModel
+from desktop_tester.models.step import RunSummary, StepResult, TestResult
 
 _STATUS_COLORS = {
     "passed": "#4caf50",
@@ -21,115 +23,111 @@ _STATUS_COLORS = {
     "skipped": "#9e9e9e",
 }
 
+_STATUS_QCOLORS = {status: QColor(color) for status, color in _STATUS_COLORS.items()}
+_DEFAULT_QCOLOR = QColor("#9e9e9e")
+_RUNNING_QCOLOR = QColor("#2196f3")
+_GROUP_BG = QColor("#2a2a2a")
+_STEP_BG = QColor("#1a1a1a")
+_GROUP_NAME_FG = QColor("#ddd")
+_CHEVRON_FG = QColor("#888")
+_STEP_ID_FG = QColor("#aaa")
+_DURATION_FG = QColor("#888")
 
-class ResultCard(QFrame):
-    """A card showing the result of a single step."""
+_GROUP_MARGIN_TOP = 6
+_GROUP_HEIGHT = 34
+_STEP_HEIGHT = 26
+_STEP_SPACING = 2
+_STATUS_COLUMN = 60  # Width reserved for the step status text
 
-    def __init__(self, result: StepResult, parent=None):
-        super().__init__(parent)
-        self.setFrameStyle(QFrame.StyledPanel)
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(16, 6, 8, 6)
-
-        # Status indicator
-        color = _STATUS_COLORS.get(result.status, "#9e9e9e")
-        indicator = QLabel(result.status.upper())
-        indicator.setStyleSheet(
-            f"color: {color}; font-weight: bold; font-size: 11px; min-width: 50px;"
-        )
-        layout.addWidget(indicator)
-
-        # Step ID
-        step_label = QLabel(result.step_id)
-        step_label.setStyleSheet("color: #aaa; font-size: 12px;")
-        layout.addWidget(step_label)
-
-        layout.addStretch()
-
-        # Duration
-        duration_label = QLabel(f"{result.duration_ms:.0f}ms")
-        duration_label.setStyleSheet("color: #888; font-size: 11px;")
-        layout.addWidget(duration_label)
+# Step results arriving within one frame are inserted together
+_RESULT_FLUSH_MS = 16
 
-        # Error message on hover
-        if result.error_message:
-            self.setToolTip(result.error_message)
-        self.setStyleSheet(f"border-left: 3px solid {color}; background-color: #1a1a1a;")
 
+class ResultDelegate(QStyledItemDelegate):
+    """Paints group headers and step result rows of a ResultListModel.
 
-class TestGroup(QWidget):
-    """A collapsible group: clickable header + step result cards."""
+    Rows are drawn directly rather than built from widgets, so only the
+    visible rows cost anything.
+    """
 
-    def __init__(self, test_name: str, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self._collapsed = False
-
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-
-        # --- Clickable header ---
-        self._header = QFrame()
-        self._header.setFrameStyle(QFrame.StyledPanel)
-        self._header.setCursor(Qt.PointingHandCursor)
-        header_layout = QHBoxLayout(self._header)
-        header_layout.setContentsMargins(8, 8, 8, 8)
-
-        self._chevron = QLabel("\u25BC")  # ▼
-        self._chevron.setStyleSheet("color: #888; font-size: 10px; min-width: 14px;")
-        header_layout.addWidget(self._chevron)
-
-        self._name_label = QLabel(test_name)
-        self._name_label.setStyleSheet(
-            "color: #ddd; font-weight: bold; font-size: 13px;"
-        )
-        header_layout.addWidget(self._name_label)
-
-        header_layout.addStretch()
-
-        self._status_label = QLabel("RUNNING...")
-        self._status_label.setStyleSheet(
-            "color: #2196f3; font-weight: bold; font-size: 11px;"
-        )
-        header_layout.addWidget(self._status_label)
-
-        self._header.setStyleSheet(
-            "background-color: #2a2a2a; border-left: 4px solid #2196f3; "
-            "margin-top: 6px;"
-        )
-        # Make the header frame clickable via mouse release event
-        self._header.mouseReleaseEvent = self._toggle_collapsed
-        layout.addWidget(self._header)
-
-        # --- Steps container ---
-        self._steps_container = QWidget()
-        self._steps_layout = QVBoxLayout(self._steps_container)
-        self._steps_layout.setContentsMargins(0, 0, 0, 0)
-        self._steps_layout.setSpacing(2)
-        layout.addWidget(self._steps_container)
-
-    def _toggle_collapsed(self, _event=None) -> None:
-        self._collapsed = not self._collapsed
-        self._steps_container.setVisible(not self._collapsed)
-        self._chevron.setText("\u25B6" if self._collapsed else "\u25BC")  # ▶ / ▼
-
-    def add_step_card(self, card: ResultCard) -> None:
-        self._steps_layout.addWidget(card)
-
-    def set_result(self, status: str, passed: int, total: int, duration_ms: float) -> None:
-        """Update the header with the final test result."""
-        color = _STATUS_COLORS.get(status, "#9e9e9e")
-        self._status_label.setText(
-            f"{status.upper()}  {passed}/{total} steps  ({duration_ms:.0f}ms)"
-        )
-        self._status_label.setStyleSheet(
-            f"color: {color}; font-weight: bold; font-size: 11px;"
-        )
-        self._header.setStyleSheet(
-            f"background-color: #2a2a2a; border-left: 4px solid {color}; "
-            f"margin-top: 6px;"
-        )
+        self._fonts: dict[str, QFont] | None = None
+
+    def sizeHint(self, option, index) -> QSize:
+        if isinstance(index.data(Qt.UserRole), ResultGroup):
+            return QSize(option.rect.width(), _GROUP_MARGIN_TOP + _GROUP_HEIGHT)
+        return QSize(option.rect.width(), _STEP_HEIGHT + _STEP_SPACING)
+
+    def paint(self, painter, option, index) -> None:
+        entry = index.data(Qt.UserRole)
+        if self._fonts is None:
+            self._fonts = self._make_fonts(option.font)
+        painter.save()
+        if isinstance(entry, ResultGroup):
+            self._paint_group(painter, option.rect, entry)
+        elif entry is not None:
+            self._paint_step(painter, option.rect, entry)
+        painter.restore()
+
+    @staticmethod
+    def _make_fonts(base: QFont) -> dict[str, QFont]:
+        def sized(pixels: int, bold: bool = False) -> QFont:
+            font = QFont(base)
+            font.setPixelSize(pixels)
+            font.setBold(bold)
+            return font
+
+        return {
+            "chevron": sized(10),
+            "name": sized(13, bold=True),
+            "status": sized(11, bold=True),
+            "step": sized(12),
+            "duration": sized(11),
+        }
+
+    def _paint_group(self, painter, rect: QRect, group: ResultGroup) -> None:
+        if group.status == "running":
+            color = _RUNNING_QCOLOR
+        else:
+            color = _STATUS_QCOLORS.get(group.status, _DEFAULT_QCOLOR)
+        rect = rect.adjusted(0, _GROUP_MARGIN_TOP, 0, 0)
+        painter.fillRect(rect, _GROUP_BG)
+        painter.fillRect(QRect(rect.left(), rect.top(), 4, rect.height()), color)
+
+        inner = rect.adjusted(12, 0, -8, 0)
+        align = Qt.AlignVCenter | Qt.AlignLeft
+        painter.setFont(self._fonts["chevron"])
+        painter.setPen(_CHEVRON_FG)
+        painter.drawText(inner, align, "\u25B6" if group.collapsed else "\u25BC")  # ▶ / ▼
+
+        painter.setFont(self._fonts["name"])
+        painter.setPen(_GROUP_NAME_FG)
+        painter.drawText(inner.adjusted(18, 0, 0, 0), align, group.test_name)
+
+        painter.setFont(self._fonts["status"])
+        painter.setPen(color)
+        painter.drawText(inner, Qt.AlignVCenter | Qt.AlignRight, group.detail)
+
+    def _paint_step(self, painter, rect: QRect, result: StepResult) -> None:
+        color = _STATUS_QCOLORS.get(result.status, _DEFAULT_QCOLOR)
+        rect = rect.adjusted(0, 0, 0, -_STEP_SPACING)
+        painter.fillRect(rect, _STEP_BG)
+        painter.fillRect(QRect(rect.left(), rect.top(), 3, rect.height()), color)
+
+        inner = rect.adjusted(16, 0, -8, 0)
+        align = Qt.AlignVCenter | Qt.AlignLeft
+        painter.setFont(self._fonts["status"])
+        painter.setPen(color)
+        painter.drawText(inner, align, result.status.upper())
+
+        painter.setFont(self._fonts["step"])
+        painter.setPen(_STEP_ID_FG)
+        painter.drawText(inner.adjusted(_STATUS_COLUMN, 0, 0, 0), align, result.step_id)
+
+        painter.setFont(self._fonts["duration"])
+        painter.setPen(_DURATION_FG)
+        painter.drawText(inner, Qt.AlignVCenter | Qt.AlignRight, f"{result.duration_ms:.0f}ms")
 
 
 class ResultsPanel(QWidget):
@@ -137,7 +135,13 @@ class ResultsPanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._current_group: TestGroup | None = None
+        self._model = ResultListModel(self)
+        self._current_group = -1  # Row of the running test's header, -1 if none
+        self._pending_results: list[StepResult] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_RESULT_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush_results)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -158,27 +162,23 @@ class ResultsPanel(QWidget):
         )
         layout.addWidget(self._summary_label)
 
-        # Scrollable area for result cards
-        self._scroll = QScrollArea()
-        self._scroll.setWidgetResizable(True)
-        self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-
-        self._results_container = QWidget()
-        self._results_layout = QVBoxLayout(self._results_container)
-        self._results_layout.setContentsMargins(4, 4, 4, 4)
-        self._results_layout.setSpacing(2)
-        self._results_layout.addStretch()
-
-        self._scroll.setWidget(self._results_container)
-        layout.addWidget(self._scroll)
+        # Result rows are painted by the delegate; only visible rows are laid out
+        self._view = QListView()
+        self._view.setModel(self._model)
+        self._view.setItemDelegate(ResultDelegate(self._view))
+        self._view.setSelectionMode(QAbstractItemView.NoSelection)
+        self._view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self._view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self._view.setStyleSheet("QListView { border: none; padding: 4px; }")
+        self._view.clicked.connect(self._on_row_clicked)
+        layout.addWidget(self._view)
 
     def clear(self) -> None:
         """Clear all results."""
-        self._current_group = None
-        while self._results_layout.count() > 1:
-            item = self._results_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        self._current_group = -1
+        self._flush_timer.stop()
+        self._pending_results.clear()
+        self._model.clear()
         self._summary_label.setText("No results yet")
         self._summary_label.setStyleSheet(
             "padding: 8px; color: #aaa; font-size: 12px; background-color: #222;"
@@ -186,36 +186,56 @@ class ResultsPanel(QWidget):
 
     def add_test_header(self, test_name: str) -> None:
         """Insert a collapsible test group. Subsequent step results appear under it."""
-        group = TestGroup(test_name)
-        self._results_layout.insertWidget(self._results_layout.count() - 1, group)
-        self._current_group = group
-        # Auto-scroll to bottom
-        self._scroll.verticalScrollBar().setValue(
-            self._scroll.verticalScrollBar().maximum()
-        )
+        self._flush_results()
+        self._current_group = self._model.add_group(test_name)
+        self._view.scrollToBottom()
 
     def add_step_result(self, result: StepResult) -> None:
-        """Add a result card for a completed step."""
-        card = ResultCard(result)
-        if self._current_group is not None:
-            self._current_group.add_step_card(card)
-        else:
-            # Fallback: no test header yet, add directly
-            self._results_layout.insertWidget(self._results_layout.count() - 1, card)
-        # Auto-scroll to bottom
-        self._scroll.verticalScrollBar().setValue(
-            self._scroll.verticalScrollBar().maximum()
-        )
+        """Queue a result row for a completed step; rows are added once per frame."""
+        self._pending_results.append(result)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def add_step_results(self, results: list[StepResult]) -> None:
+        """Add result rows for several completed steps at once."""
+        self._pending_results.extend(results)
+        self._flush_results()
+
+    def _flush_results(self) -> None:
+        self._flush_timer.stop()
+        if not self._pending_results:
+            return
+        batch, self._pending_results = self._pending_results, []
+        # Without a test header yet, the rows stand alone
+        rows = self._model.add_results(batch)
+        group = self._model.group_at(self._current_group)
+        if group is not None and group.collapsed:
+            for row in rows:
+                self._view.setRowHidden(row, True)
+        self._view.scrollToBottom()
+
+    def _on_row_clicked(self, index) -> None:
+        """Collapse or expand a test group when its header is clicked."""
+        row = index.row()
+        group = self._model.group_at(row)
+        if group is None:
+            return
+        collapsed = not group.collapsed
+        self._model.set_group_collapsed(row, collapsed)
+        for step_row in self._model.group_rows(row):
+            self._view.setRowHidden(step_row, collapsed)
 
     def set_test_result(self, result: TestResult) -> None:
         """Update the current test group header with the final result."""
+        self._flush_results()
         passed = sum(1 for r in result.step_results if r.status == "passed")
         total = len(result.step_results)
 
-        if self._current_group is not None:
-            self._current_group.set_result(
-                result.status, passed, total, result.duration_ms
-            )
+        self._model.set_group_result(
+            self._current_group,
+            result.status,
+            f"{result.status.upper()}  {passed}/{total} steps  ({result.duration_ms:.0f}ms)",
+        )
 
         # Also update the summary label for single-test runs
         color = _STATUS_COLORS.get(result.status, "#9e9e9e")
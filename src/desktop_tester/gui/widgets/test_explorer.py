@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QFileSystemWatcher, Qt, Signal
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -17,6 +17,7 @@ from PySide6.QtWidgets import (
 )
 
 from desktop_tester.gui.models.test_tree_model import TestTreeModel
+from desktop_tester.models.serialization import list_test_files
 
 
 class TestExplorer(QWidget):
@@ -32,6 +33,12 @@ class TestExplorer(QWidget):
         super().__init__(parent)
         self._model = TestTreeModel()
 
+        # Tests dir is watched so file adds/removes update single rows
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_tests_dir_changed)
+        self._tests_dir: Path | None = None
+        self._known_tests: set[Path] = set()
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
@@ -93,10 +100,55 @@ class TestExplorer(QWidget):
         return self._model
 
     def load_project(self, project_dir: Path, tests_dir: str = "tests") -> None:
-        """Load the test files from a project directory."""
+        """Load the test files from a project directory.
+
+        Later changes to the tests directory are applied row by row.
+        """
         self._model.load_project(project_dir, tests_dir)
         self._tree.expandAll()
 
+        watched = self._watcher.directories()
+        if watched:
+            self._watcher.removePaths(watched)
+        self._tests_dir = project_dir / tests_dir
+        self._known_tests = set(self._model.test_paths())
+        if self._tests_dir.is_dir():
+            self._watcher.addPath(str(self._tests_dir))
+
+    def test_files(self) -> list[Path]:
+        """The project's test files, kept current by the directory watcher."""
+        return sorted(self._known_tests)
+
+    def add_test(self, path: Path) -> None:
+        """Show a test file written by the app without waiting for the watcher."""
+        if path not in self._known_tests:
+            self._known_tests.add(path)
+            self._model.add_test(path)
+            self._tree.expandAll()
+        # A tests dir created after the project was opened is not watched yet
+        if (
+            self._tests_dir is not None
+            and not self._watcher.directories()
+            and self._tests_dir.is_dir()
+        ):
+            self._watcher.addPath(str(self._tests_dir))
+
+    def remove_test(self, path: Path) -> None:
+        """Drop a deleted test file's row without waiting for the watcher."""
+        if path in self._known_tests:
+            self._known_tests.discard(path)
+            self._model.remove_test(path)
+
+    def _on_tests_dir_changed(self, _path: str) -> None:
+        if self._tests_dir is None:
+            return
+        current = set(list_test_files(self._tests_dir))
+        for path in sorted(self._known_tests - current):
+            self._model.remove_test(path)
+        for path in sorted(current - self._known_tests):
+            self._model.add_test(path)
+        self._known_tests = current
+
     def _on_double_click(self, index) -> None:
         path = self._model.get_file_path(index)
         if path and path.suffix == ".yaml":
@@ -126,4 +178,5 @@ class TestExplorer(QWidget):
         )
         if reply == QMessageBox.Yes:
             path.unlink()
+            self.remove_test(path)
             self.test_deleted.emit(path)
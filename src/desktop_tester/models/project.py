@@ -21,7 +21,7 @@ class TargetApp:
             path=data.get("path"),
             bundle_id=data.get("bundle_id"),
             name=data.get("name"),
-            launch_args=data.get("launch_args", []),
+            launch_args=list(data.get("launch_args", [])),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -67,7 +67,7 @@ class ProjectSettings:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectConfig:
     """Top-level project configuration (project.yaml)."""
 
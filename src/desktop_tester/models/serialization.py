@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import copy
+import os
 from pathlib import Path
 from typing import Any
 
@@ -10,11 +12,53 @@ import yaml
 from desktop_tester.models.project import ProjectConfig
 from desktop_tester.models.step import ActionType, Step
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+
+# Parsed YAML keyed by path, stamped with (st_mtime_ns, st_size) so edits
+# made between runs are picked up.
+_YAML_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+def _parse_yaml(path: Path) -> dict[str, Any]:
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_SafeLoader) or {}
+
+
+def get_cached_yaml(path: Path, raw: bytes | None = None) -> dict[str, Any]:
+    """Return the parsed contents of a YAML file, parsing it at most once per version.
+
+    *raw* may hold the file's bytes when the caller has already read them,
+    so a cache miss parses those instead of reopening the file.
+
+    The returned dict is shared with the cache and must not be mutated;
+    use load_yaml() when a private copy is needed.
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = str(path)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    if raw is None:
+        data = _parse_yaml(path)
+    else:
+        data = yaml.load(raw, Loader=_SafeLoader) or {}
+    _YAML_CACHE[key] = (stamp, data)
+    return data
+
+
+def clear_yaml_cache() -> None:
+    """Drop all cached YAML parses."""
+    _YAML_CACHE.clear()
+
 
 def load_yaml(path: Path) -> dict[str, Any]:
     """Load and parse a YAML file."""
-    with open(path, "r") as f:
-        return yaml.safe_load(f) or {}
+    return copy.deepcopy(get_cached_yaml(path))
 
 
 def save_yaml(path: Path, data: dict[str, Any]) -> None:
@@ -22,11 +66,14 @@ def save_yaml(path: Path, data: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with open(path, "w") as f:
         yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    _YAML_CACHE.pop(str(path), None)
 
 
 def load_project(path: Path) -> ProjectConfig:
     """Load a project.yaml file into a ProjectConfig."""
-    data = load_yaml(path)
+    # ProjectConfig.from_dict copies everything it keeps, so the shared
+    # cached dict can be used directly.
+    data = get_cached_yaml(path)
     return ProjectConfig.from_dict(data)
 
 
@@ -85,6 +132,17 @@ def step_to_dict(step: Step) -> dict[str, Any]:
     return d
 
 
+def list_test_files(tests_dir: Path) -> list[Path]:
+    """Return the *.yaml files directly inside tests_dir, sorted by name."""
+    try:
+        with os.scandir(tests_dir) as it:
+            names = [e.name for e in it if e.name.endswith(".yaml") and e.is_file()]
+    except FileNotFoundError:
+        return []
+    names.sort()
+    return [tests_dir / name for name in names]
+
+
 def load_test_file(path: Path) -> dict[str, Any]:
     """Load a test YAML file and parse its steps into Step objects.
 
@@ -82,7 +82,7 @@ class Step:
     continue_on_failure: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     """Result of executing a single step."""
 
@@ -96,7 +96,7 @@ class StepResult:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Result of executing a full test case."""
 
@@ -109,7 +109,7 @@ class TestResult:
     finished_at: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class RunSummary:
     """Summary of a complete test run (multiple test files)."""
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import base64
 from datetime import datetime
+from functools import cache
 from pathlib import Path
 
 from jinja2 import Environment, PackageLoader, select_autoescape
@@ -11,15 +12,22 @@ from jinja2 import Environment, PackageLoader, select_autoescape
 from desktop_tester.models.step import RunSummary
 
 
+@cache
+def _environment() -> Environment:
+    """Return the shared Jinja2 environment, so templates compile once per process."""
+    env = Environment(
+        loader=PackageLoader("desktop_tester", "reporter/templates"),
+        autoescape=select_autoescape(["html"]),
+    )
+    env.filters["basename"] = lambda path: Path(path).name if path else ""
+    return env
+
+
 class HTMLReporter:
     """Generates self-contained HTML reports."""
 
     def __init__(self):
-        self._env = Environment(
-            loader=PackageLoader("desktop_tester", "reporter/templates"),
-            autoescape=select_autoescape(["html"]),
-        )
-        self._env.filters["basename"] = lambda path: Path(path).name if path else ""
+        self._env = _environment()
 
     def generate(self, summary: RunSummary, output_path: Path) -> Path:
         """Generate a self-contained HTML report."""
@@ -43,7 +51,7 @@ class HTMLReporter:
         )
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(html)
+        output_path.write_text(html, encoding="utf-8")
         return output_path
 
     def _encode_screenshot(self, path: str) -> str:
@@ -6,16 +6,38 @@ import json
 from dataclasses import asdict
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from desktop_tester.models.step import RunSummary
 
+_WRITE_BUFFER_SIZE = 1 << 20
+
 
 class JSONReporter:
     """Generates JSON reports from test results."""
 
-    def generate(self, summary: RunSummary, output_path: Path) -> Path:
-        """Generate a JSON report file."""
+    def generate(self, summary: RunSummary, output_path: Path, pretty: bool = False) -> Path:
+        """Generate a JSON report file.
+
+        Output is compact unless *pretty* is set.
+        """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         data = asdict(summary)
-        output_path.write_text(json.dumps(data, indent=2, default=str))
+        if orjson is not None:
+            option = orjson.OPT_APPEND_NEWLINE
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            output_path.write_bytes(orjson.dumps(data, default=str, option=option))
+            return output_path
+
+        with open(output_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            if pretty:
+                json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+            else:
+                json.dump(data, f, separators=(",", ":"), default=str, ensure_ascii=False)
+            f.write("\n")
         return output_path
@@ -19,5 +19,7 @@ class ReportGenerator:
     def generate_html(self, summary: RunSummary, output_path: Path) -> Path:
         return self._html.generate(summary, output_path)
 
-    def generate_json(self, summary: RunSummary, output_path: Path) -> Path:
-        return self._json.generate(summary, output_path)
+    def generate_json(
+        self, summary: RunSummary, output_path: Path, pretty: bool = False
+    ) -> Path:
+        return self._json.generate(summary, output_path, pretty=pretty)
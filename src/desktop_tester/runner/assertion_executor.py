@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import re
 import time
+from dataclasses import replace
 from typing import Any
 
 from desktop_tester.core.engine import AutomationEngine
 from desktop_tester.core.locator import LocatorStrategy
-from desktop_tester.exceptions import AssertionError as DTAssertionError
+from desktop_tester.exceptions import TestAssertionError
 from desktop_tester.models.step import AssertionType, ComparisonOperator, Step, StepResult
 
 
@@ -81,7 +82,7 @@ class AssertionExecutor:
                 duration_ms=duration, description=desc,
             )
 
-        except DTAssertionError as e:
+        except TestAssertionError as e:
             duration = (time.time() - start) * 1000
             return StepResult(
                 step_id=step.id, status="failed", description=desc,
@@ -99,28 +100,28 @@ class AssertionExecutor:
     def _resolve_target(self, target: dict | None) -> Any:
         """Find the target element from a locator dict."""
         if not target:
-            raise DTAssertionError("Assertion missing target")
+            raise TestAssertionError("Assertion missing target")
         locator = LocatorStrategy.from_dict(target)
         return self._engine.find_element(locator)
 
     def _assert_element_exists(self, target: dict | None) -> None:
         if not target:
-            raise DTAssertionError("Assertion missing target")
+            raise TestAssertionError("Assertion missing target")
         locator = LocatorStrategy.from_dict(target)
         try:
             self._engine.find_element(locator)
         except Exception:
-            raise DTAssertionError("Expected element to exist, but it was not found")
+            raise TestAssertionError("Expected element to exist, but it was not found")
 
     def _assert_element_not_exists(self, target: dict | None) -> None:
         if not target:
-            raise DTAssertionError("Assertion missing target")
-        locator = LocatorStrategy.from_dict(target)
-        locator.timeout = 1.0  # Short timeout for "not exists"
+            raise TestAssertionError("Assertion missing target")
+        # Short timeout for "not exists"
+        locator = replace(LocatorStrategy.from_dict(target), timeout=1.0)
         try:
             self._engine.find_element(locator)
-            raise DTAssertionError("Expected element to not exist, but it was found")
-        except DTAssertionError:
+            raise TestAssertionError("Expected element to not exist, but it was found")
+        except TestAssertionError:
             raise
         except Exception:
             pass  # Element not found — assertion passes
@@ -147,7 +148,7 @@ class AssertionExecutor:
         element = self._resolve_target(target)
         expected = assertion.get("expected", True)
         if element.enabled != expected:
-            raise DTAssertionError(
+            raise TestAssertionError(
                 f"Expected enabled={expected}, got enabled={element.enabled}",
                 expected=expected, actual=element.enabled,
             )
@@ -156,14 +157,14 @@ class AssertionExecutor:
         element = self._resolve_target(target)
         expected = assertion.get("expected", True)
         if element.visible != expected:
-            raise DTAssertionError(
+            raise TestAssertionError(
                 f"Expected visible={expected}, got visible={element.visible}",
                 expected=expected, actual=element.visible,
             )
 
     def _assert_element_count(self, target: dict | None, assertion: dict) -> int:
         if not target:
-            raise DTAssertionError("Assertion missing target")
+            raise TestAssertionError("Assertion missing target")
         locator = LocatorStrategy.from_dict(target)
         elements = self._engine.find_elements(locator)
         actual = len(elements)
@@ -204,7 +205,7 @@ class AssertionExecutor:
             passed = bool(re.search(expected, actual))
 
         if not passed:
-            raise DTAssertionError(
+            raise TestAssertionError(
                 f"Assertion failed: {field_name} {operator.value} "
                 f"expected '{expected}', got '{actual}'",
                 expected=expected, actual=actual,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from dataclasses import replace
 
 from desktop_tester.core.engine import AutomationEngine
 from desktop_tester.core.locator import LocatorStrategy
@@ -87,9 +88,9 @@ class StepExecutor:
             raise ValueError(f"Step {step.id} has no target defined")
         locator = LocatorStrategy.from_dict(step.target)
         if step.timeout:
-            locator.timeout = step.timeout
+            locator = replace(locator, timeout=step.timeout)
         elif locator.timeout == 5.0:
-            locator.timeout = context.default_timeout
+            locator = replace(locator, timeout=context.default_timeout)
         return self._engine.find_element(locator)
 
     def _do_click(self, step: Step, context: RunContext) -> None:
@@ -156,8 +157,7 @@ class StepExecutor:
     def _do_wait_for_element_gone(self, step: Step, context: RunContext) -> None:
         if not step.target:
             raise ValueError(f"Step {step.id} wait_for_element_gone has no target")
-        locator = LocatorStrategy.from_dict(step.target)
-        locator.timeout = 0.5  # Quick check
+        locator = replace(LocatorStrategy.from_dict(step.target), timeout=0.5)  # Quick check
         timeout = step.timeout or context.default_timeout
         deadline = time.time() + timeout
         while time.time() < deadline:
@@ -0,0 +1,49 @@
+"""Tests for application lifecycle management."""
+
+import pytest
+
+from desktop_tester.core.app_manager import AppManager
+from desktop_tester.models.project import TargetApp
+
+
+class FakeBackend:
+    def __init__(self, running=()):
+        self.running = set(running)
+        self.calls = []
+
+    def attach_to_application(self, identifier):
+        self.calls.append(("attach", identifier))
+        if identifier not in self.running:
+            raise LookupError(identifier)
+        return f"ref:{identifier}"
+
+    def launch_application(self, path, args=None):
+        self.calls.append(("launch", path))
+        return f"ref:{path}"
+
+
+class TestLaunchOrAttach:
+    def test_attaches_when_running(self):
+        backend = FakeBackend(running={"com.example.app"})
+        manager = AppManager(backend)
+        ref = manager.launch_or_attach(TargetApp(bundle_id="com.example.app"))
+        assert ref == "ref:com.example.app"
+        assert backend.calls == [("attach", "com.example.app")]
+
+    def test_launches_when_not_running(self):
+        backend = FakeBackend()
+        manager = AppManager(backend)
+        manager.launch_or_attach(TargetApp(name="Example"))
+        assert backend.calls == [("attach", "Example"), ("launch", "Example")]
+        assert manager.is_connected
+
+    def test_path_only_skips_attach(self):
+        backend = FakeBackend()
+        manager = AppManager(backend)
+        manager.launch_or_attach(TargetApp(path="/Applications/Example.app"))
+        assert backend.calls == [("launch", "/Applications/Example.app")]
+
+    def test_missing_identifier(self):
+        manager = AppManager(FakeBackend())
+        with pytest.raises(ValueError):
+            manager.launch_or_attach(TargetApp())
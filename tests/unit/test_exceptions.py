@@ -0,0 +1,51 @@
+"""Tests for the exception hierarchy."""
+
+import builtins
+import pickle
+
+from desktop_tester import exceptions
+from desktop_tester.exceptions import (
+    DesktopTesterError,
+    ElementNotFoundError,
+    TestAssertionError,
+)
+
+
+class TestElementNotFoundError:
+    def test_message(self):
+        err = ElementNotFoundError({"type": "accessibility_id", "value": "ok"}, 5.0)
+        assert str(err) == (
+            "Element not found: {'type': 'accessibility_id', 'value': 'ok'} (timeout: 5.0s)"
+        )
+        assert isinstance(err, DesktopTesterError)
+
+    def test_locator_not_formatted_until_needed(self):
+        class Locator:
+            formatted = 0
+
+            def __str__(self):
+                Locator.formatted += 1
+                return "loc"
+
+        err = ElementNotFoundError(Locator())
+        assert Locator.formatted == 0
+        assert str(err) == "Element not found: loc (timeout: 0s)"
+        assert Locator.formatted == 1
+
+    def test_repr_and_pickle(self):
+        err = ElementNotFoundError("button:OK", 2.0)
+        assert repr(err) == "ElementNotFoundError('button:OK', 2.0)"
+        restored = pickle.loads(pickle.dumps(err))
+        assert (restored.locator, restored.timeout) == ("button:OK", 2.0)
+        assert str(restored) == str(err)
+
+
+class TestTestAssertionError:
+    def test_fields(self):
+        err = TestAssertionError("mismatch", expected="1", actual="2")
+        assert str(err) == "mismatch"
+        assert (err.expected, err.actual) == ("1", "2")
+
+    def test_deprecated_alias(self):
+        assert exceptions.AssertionError is TestAssertionError
+        assert not issubclass(TestAssertionError, builtins.AssertionError)
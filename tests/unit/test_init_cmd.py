@@ -0,0 +1,43 @@
+"""Tests for the init command."""
+
+from desktop_tester.cli.init_cmd import _EXAMPLE_TEST_YAML, execute_init
+from desktop_tester.models.serialization import load_project, save_test_file
+from desktop_tester.models.step import ActionType, Step
+
+
+class TestExampleTest:
+    def test_matches_serializer_output(self, tmp_path):
+        path = tmp_path / "test_example.yaml"
+        save_test_file(
+            path,
+            name="Example Test",
+            steps=[
+                Step(
+                    id="step_1",
+                    action=ActionType.CLICK,
+                    description="Click a button",
+                    target={"type": "role_title", "role": "button", "value": "OK"},
+                ),
+            ],
+            description="An example test to get you started",
+            setup=[
+                Step(id="setup_1", action=ActionType.LAUNCH_APP, description="Launch app"),
+            ],
+            teardown=[
+                Step(id="teardown_1", action=ActionType.CLOSE_APP, description="Close app"),
+            ],
+        )
+        assert path.read_text() == _EXAMPLE_TEST_YAML
+
+
+class TestExecuteInit:
+    def test_creates_project(self, tmp_path):
+        project_dir = tmp_path / "proj"
+        execute_init(str(project_dir), "My Tests", "com.example.app")
+
+        config = load_project(project_dir / "project.yaml")
+        assert config.name == "My Tests"
+        assert config.target_app.bundle_id == "com.example.app"
+        for sub in ("tests", "fixtures", "screenshots", "reports"):
+            assert (project_dir / sub).is_dir()
+        assert (project_dir / "tests" / "test_example.yaml").read_text() == _EXAMPLE_TEST_YAML
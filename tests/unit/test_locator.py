@@ -1,5 +1,7 @@
 """Tests for locator strategies."""
 
+import dataclasses
+
 import pytest
 
 from desktop_tester.core.locator import LocatorStrategy, LocatorType
@@ -86,3 +88,16 @@ class TestLocatorStrategy:
         assert restored.role == original.role
         assert restored.index == original.index
         assert restored.timeout == original.timeout
+
+    def test_to_dict_is_memoized(self):
+        loc = LocatorStrategy(type=LocatorType.ROLE_AND_TITLE, value="OK", role="button")
+        assert loc.to_dict() is loc.to_dict()
+
+    def test_immutable(self):
+        loc = LocatorStrategy(type=LocatorType.ACCESSIBILITY_ID, value="btnOK")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            loc.timeout = 1.0
+        shorter = dataclasses.replace(loc, timeout=1.0)
+        assert shorter.timeout == 1.0
+        assert shorter.to_dict()["timeout"] == 1.0
+        assert "timeout" not in loc.to_dict()
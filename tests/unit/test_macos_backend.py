@@ -0,0 +1,30 @@
+"""Tests for macOS backend helpers."""
+
+import pytest
+
+macos_backend = pytest.importorskip("desktop_tester.core.macos_backend", exc_type=ImportError)
+
+
+class TestIsWebBundle:
+    @pytest.mark.parametrize(
+        "bundle_id",
+        [
+            "com.google.Chrome",
+            "com.microsoft.edgemac",
+            "org.chromium.Chromium",
+            "com.apple.Safari",
+            "com.apple.SafariTechnologyPreview",
+            "com.apple.WebKit.WebContent",
+        ],
+    )
+    def test_web_bundle_ids(self, bundle_id):
+        assert macos_backend._is_web_bundle(bundle_id, None)
+
+    def test_native_bundle_id(self):
+        assert not macos_backend._is_web_bundle("com.apple.TextEdit", None)
+
+    def test_electron_framework(self, tmp_path):
+        frameworks = tmp_path / "Contents" / "Frameworks"
+        (frameworks / "Electron Framework.framework").mkdir(parents=True)
+        assert macos_backend._is_web_bundle("com.example.app", tmp_path)
+        assert not macos_backend._is_web_bundle("com.example.app", tmp_path / "missing")
@@ -69,6 +69,10 @@ class TestStepResult:
         assert result.status == "failed"
         assert result.error_message == "Element not found"
 
+    def test_slotted(self):
+        result = StepResult(step_id="step_1", status="passed")
+        assert not hasattr(result, "__dict__")
+
 
 class TestTestResult:
     def test_create_test_result(self):
@@ -90,6 +94,9 @@ class TestRunSummary:
         assert summary.failed == 0
         assert summary.test_results == []
 
+    def test_slotted(self):
+        assert not hasattr(RunSummary(), "__dict__")
+
 
 class TestUIElement:
     def test_create_element(self):
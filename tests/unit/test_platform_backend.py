@@ -0,0 +1,32 @@
+"""Tests for the shared platform backend factory."""
+
+import pytest
+
+from desktop_tester import core
+
+
+@pytest.fixture
+def fresh_backend(monkeypatch):
+    created = []
+
+    def create():
+        created.append(object())
+        return created[-1]
+
+    core._reset_backend_for_tests()
+    monkeypatch.setattr(core, "_create_platform_backend", create)
+    yield created
+    core._reset_backend_for_tests()
+
+
+class TestGetPlatformBackend:
+    def test_backend_is_shared(self, fresh_backend):
+        assert core.get_platform_backend() is core.get_platform_backend()
+        assert len(fresh_backend) == 1
+
+    def test_reset_creates_new_backend(self, fresh_backend):
+        first = core.get_platform_backend()
+        core._reset_backend_for_tests()
+        second = core.get_platform_backend()
+        assert first is not second
+        assert len(fresh_backend) == 2
@@ -0,0 +1,69 @@
+"""Tests for report generation."""
+
+import json
+
+import pytest
+
+from desktop_tester.models.step import RunSummary, StepResult, TestResult
+from desktop_tester.reporter.json_reporter import JSONReporter
+
+
+@pytest.fixture
+def summary():
+    return RunSummary(
+        total=1,
+        passed=1,
+        test_results=[
+            TestResult(
+                test_name="Test 1",
+                test_file="test_1.yaml",
+                status="passed",
+                step_results=[StepResult(step_id="step_1", status="passed")],
+            ),
+        ],
+    )
+
+
+class TestJSONReporter:
+    def test_compact_by_default(self, tmp_path, summary):
+        path = JSONReporter().generate(summary, tmp_path / "report.json")
+        text = path.read_text()
+        assert "\n" not in text.rstrip("\n")
+        data = json.loads(text)
+        assert data["total"] == 1
+        assert data["test_results"][0]["step_results"][0]["step_id"] == "step_1"
+
+    def test_pretty(self, tmp_path, summary):
+        path = JSONReporter().generate(summary, tmp_path / "report.json", pretty=True)
+        text = path.read_text()
+        assert text.count("\n") > 1
+        assert json.loads(text)["passed"] == 1
+
+
+class TestReportCommand:
+    def test_json_roundtrip(self, tmp_path, summary):
+        from desktop_tester.cli.report_cmd import execute_report
+
+        json_path = JSONReporter().generate(summary, tmp_path / "report.json")
+        out_path = tmp_path / "copy.json"
+        execute_report(str(json_path), "json", str(out_path))
+
+        data = json.loads(out_path.read_text())
+        assert data["total"] == 1
+        assert data["test_results"][0]["test_name"] == "Test 1"
+        assert data["test_results"][0]["step_results"][0]["status"] == "passed"
+
+
+class TestHTMLReporter:
+    def test_generate(self, tmp_path, summary):
+        from desktop_tester.reporter.html_reporter import HTMLReporter
+
+        path = HTMLReporter().generate(summary, tmp_path / "report.html")
+        html = path.read_text(encoding="utf-8")
+        assert "Test 1" in html
+        assert "test_1.yaml" in html
+
+    def test_environment_shared(self):
+        from desktop_tester.reporter.html_reporter import HTMLReporter
+
+        assert HTMLReporter()._env is HTMLReporter()._env
@@ -0,0 +1,41 @@
+"""Tests for the run command helpers."""
+
+import pytest
+
+from desktop_tester.cli.run_cmd import _filter_by_tags
+
+
+@pytest.fixture
+def test_files(tmp_path):
+    files = {
+        "test_flow.yaml": "name: Flow\ntags: [smoke, regression]\n",
+        "test_block.yaml": "name: Block\ntags:\n  - regression\n",
+        "test_untagged.yaml": "name: Untagged\n",
+        "test_mention.yaml": "name: Mentions smoke in its name only\n",
+    }
+    paths = []
+    for name, text in sorted(files.items()):
+        path = tmp_path / name
+        path.write_text(text)
+        paths.append(path)
+    return paths
+
+
+class TestFilterByTags:
+    def test_flow_and_block_lists(self, test_files):
+        result = _filter_by_tags(test_files, ("regression",))
+        assert [p.name for p in result] == ["test_block.yaml", "test_flow.yaml"]
+
+    def test_text_match_is_confirmed_by_parse(self, test_files):
+        # test_mention.yaml passes the byte pre-scan but has no tags list
+        result = _filter_by_tags(test_files, ("smoke",))
+        assert [p.name for p in result] == ["test_flow.yaml"]
+
+    def test_prescan_skips_files_without_tag_text(self, test_files, tmp_path):
+        broken = tmp_path / "test_broken.yaml"
+        broken.write_text("name: [unclosed\n")
+        result = _filter_by_tags([broken, *test_files], ("smoke",))
+        assert [p.name for p in result] == ["test_flow.yaml"]
+
+    def test_no_matches(self, test_files):
+        assert _filter_by_tags(test_files, ("missing",)) == []
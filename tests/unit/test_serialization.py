@@ -8,6 +8,9 @@ from desktop_tester.models.serialization import (
     dict_to_step,
     step_to_dict,
     load_yaml,
+    clear_yaml_cache,
+    get_cached_yaml,
+    list_test_files,
     load_project,
     load_test_file,
     save_test_file,
@@ -143,3 +146,62 @@ class TestSaveTestFile:
         assert len(data["steps"]) == 2
         assert data["steps"][0].action == ActionType.CLICK
         assert data["steps"][1].text == "Hello"
+
+
+class TestYamlCache:
+    def test_reuses_parse_until_file_changes(self, tmp_path):
+        path = tmp_path / "test_cache.yaml"
+        path.write_text("name: First\ntags: [smoke]\n")
+
+        first = get_cached_yaml(path)
+        assert get_cached_yaml(path) is first
+
+        path.write_text("name: Second, longer\ntags: [smoke]\n")
+        assert get_cached_yaml(path)["name"] == "Second, longer"
+
+    def test_clear_forces_reparse(self, tmp_path):
+        path = tmp_path / "test_clear.yaml"
+        path.write_text("name: Cleared\n")
+
+        first = get_cached_yaml(path)
+        clear_yaml_cache()
+        second = get_cached_yaml(path)
+        assert second is not first
+        assert second == first
+
+    def test_load_yaml_returns_private_copy(self, tmp_path):
+        path = tmp_path / "test_copy.yaml"
+        path.write_text("name: Copy\ntags: [smoke]\n")
+
+        data = load_yaml(path)
+        data["tags"].append("mutated")
+        assert get_cached_yaml(path)["tags"] == ["smoke"]
+
+    def test_save_invalidates(self, tmp_path):
+        path = tmp_path / "test_save.yaml"
+        save_test_file(path, name="Before", steps=[])
+        assert load_test_file(path)["name"] == "Before"
+        save_test_file(path, name="After", steps=[])
+        assert load_test_file(path)["name"] == "After"
+
+    def test_load_project_does_not_share_cached_lists(self, tmp_path):
+        path = tmp_path / "project.yaml"
+        path.write_text("name: P\ntarget_app:\n  launch_args: [--fast]\n")
+
+        config = load_project(path)
+        config.target_app.launch_args.append("--mutated")
+        assert load_project(path).target_app.launch_args == ["--fast"]
+
+
+class TestListTestFiles:
+    def test_sorted_yaml_files_only(self, tmp_path):
+        for name in ("test_b.yaml", "test_a.yaml", "notes.txt"):
+            (tmp_path / name).write_text("name: x\n")
+        (tmp_path / "nested.yaml").mkdir()
+
+        paths = list_test_files(tmp_path)
+        assert [p.name for p in paths] == ["test_a.yaml", "test_b.yaml"]
+        assert paths[0] == tmp_path / "test_a.yaml"
+
+    def test_missing_directory(self, tmp_path):
+        assert list_test_files(tmp_path / "missing") == []
@@ -0,0 +1,17 @@
+"""Tests for the Windows backend stub."""
+
+import pytest
+
+from desktop_tester.core.platform_base import PlatformBackend
+from desktop_tester.core.windows_backend import WindowsBackend
+
+
+class TestWindowsBackendStub:
+    def test_instantiable(self):
+        assert isinstance(WindowsBackend(), PlatformBackend)
+
+    def test_abstract_methods_raise(self):
+        backend = WindowsBackend()
+        for name in PlatformBackend.__abstractmethods__:
+            with pytest.raises(NotImplementedError):
+                getattr(backend, name)()